@@ -6,8 +6,11 @@ Each agent specializes in a specific aspect of campaign creation.
 
 import os
 import json
+import atexit
+import asyncio
 import requests
-from typing import Dict, Any
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Tuple
 import logging
 
 # Constants
@@ -37,12 +40,59 @@ except ImportError:
     GENAI_AVAILABLE = False
     logger.warning("Google Generative AI package not available")
 
+# aiohttp backs the async API calls; without it they run the sync calls in a thread
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+MISTRAL_URL = "https://api.mistral.ai/v1/chat/completions"
+HUGGINGFACE_URL = "https://api-inference.huggingface.co/models/{model}"
+
+# Responses containing these markers trigger the next provider in the chain
+DEFAULT_FALLBACK_MARKERS = (ErrorMessages.PREFIX,)
+
+# Keep-alive connections per provider host for the sync API calls
+HTTP_POOL_SIZE = 32
+
+def _build_http_session() -> requests.Session:
+    """Create a pooled session so sync API calls reuse warm TLS connections."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE))
+    return session
+
+# Shared by every agent and opened at import, so no call pays for pool setup
+_HTTP_SESSION = _build_http_session()
+atexit.register(_HTTP_SESSION.close)
+
+def _pretty_json(obj: Any) -> str:
+    """Indented JSON for prompts, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+def _loads_json(data) -> Any:
+    """Decode an API response body, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class AIAgent:
     """Base class for all AI agents."""
     
     def __init__(self, name: str):
         self.name = name
         self.gemini_model = None
+        self.http = _HTTP_SESSION
         self.setup_clients()
     
     def setup_clients(self):
@@ -81,15 +131,15 @@ class AIAgent:
                 "max_tokens": 500
             }
             
-            response = requests.post(
-                "https://api.mistral.ai/v1/chat/completions",
+            response = self.http.post(
+                MISTRAL_URL,
                 headers=headers,
                 json=payload,
                 timeout=30
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = _loads_json(response.content)
                 if "choices" in result and len(result["choices"]) > 0:
                     return result["choices"][0]["message"]["content"]
                 return str(result)
@@ -122,15 +172,15 @@ class AIAgent:
                 }
             }
             
-            response = requests.post(
-                f"https://api-inference.huggingface.co/models/{model}",
+            response = self.http.post(
+                HUGGINGFACE_URL.format(model=model),
                 headers=headers,
                 json=payload,
                 timeout=30
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = _loads_json(response.content)
                 if isinstance(result, list) and len(result) > 0:
                     return result[0].get("generated_text", "").replace(prompt, "").strip()
                 return str(result)
@@ -155,6 +205,103 @@ class AIAgent:
         except (AttributeError, ValueError, RuntimeError) as e:
             logger.error(f"{ErrorMessages.GEMINI_ERROR}: {e}")
             return f"{ErrorMessages.PREFIX} {str(e)}"
+    
+    async def acall_gemini_api(self, prompt: str) -> str:
+        """Async variant of call_gemini_api."""
+        if not self.gemini_model or not hasattr(self.gemini_model, 'generate_content_async'):
+            return await asyncio.to_thread(self.call_gemini_api, prompt)
+        try:
+            response = await self.gemini_model.generate_content_async(prompt)
+            if hasattr(response, 'text'):
+                return response.text
+            return "No response generated"
+        except (AttributeError, ValueError, RuntimeError) as e:
+            logger.error(f"{ErrorMessages.GEMINI_ERROR}: {e}")
+            return f"{ErrorMessages.PREFIX} {str(e)}"
+    
+    async def acall_mistral_api(self, session, prompt: str, model: str = "mistral-small-latest") -> str:
+        """Async variant of call_mistral_api using a shared aiohttp session."""
+        if session is None:
+            return await asyncio.to_thread(self.call_mistral_api, prompt, model)
+        try:
+            mistral_token = os.getenv("MISTRAL_API_KEY")
+            if not mistral_token:
+                return "Mistral API key not available"
+            
+            headers = {
+                "Authorization": f"Bearer {mistral_token}",
+                "Content-Type": "application/json"
+            }
+            
+            payload = {
+                "model": model,
+                "messages": [
+                    {"role": "user", "content": prompt}
+                ],
+                "temperature": 0.7,
+                "max_tokens": 500
+            }
+            
+            async with session.post(MISTRAL_URL, headers=headers, json=payload,
+                                    timeout=aiohttp.ClientTimeout(total=30)) as response:
+                if response.status == 200:
+                    result = await response.json(loads=_loads_json)
+                    if "choices" in result and len(result["choices"]) > 0:
+                        return result["choices"][0]["message"]["content"]
+                    return str(result)
+                logger.error(f"Mistral API error: {response.status} - {await response.text()}")
+                return f"API Error: {response.status}"
+                
+        except Exception as e:
+            logger.error(f"Error calling Mistral API: {e}")
+            return f"Error: {str(e)}"
+    
+    async def acall_huggingface_api(self, session, prompt: str, model: str = "mistralai/Mistral-7B-Instruct-v0.1") -> str:
+        """Async variant of call_huggingface_api using a shared aiohttp session."""
+        if session is None:
+            return await asyncio.to_thread(self.call_huggingface_api, prompt, model)
+        try:
+            hf_token = os.getenv("HUGGINGFACE_API_TOKEN")
+            if not hf_token:
+                return "HuggingFace API key not available"
+            
+            headers = {
+                "Authorization": f"Bearer {hf_token}",
+                "Content-Type": "application/json"
+            }
+            
+            payload = {
+                "inputs": prompt,
+                "parameters": {
+                    "max_new_tokens": 500,
+                    "temperature": 0.7,
+                    "top_p": 0.9
+                }
+            }
+            
+            async with session.post(HUGGINGFACE_URL.format(model=model), headers=headers, json=payload,
+                                    timeout=aiohttp.ClientTimeout(total=30)) as response:
+                if response.status == 200:
+                    result = await response.json(loads=_loads_json)
+                    if isinstance(result, list) and len(result) > 0:
+                        return result[0].get("generated_text", "").replace(prompt, "").strip()
+                    return str(result)
+                logger.error(f"HuggingFace API error: {response.status} - {await response.text()}")
+                return f"API Error: {response.status}"
+                
+        except Exception as e:
+            logger.error(f"Error calling HuggingFace API: {e}")
+            return f"Error: {str(e)}"
+    
+    async def agenerate(self, session, prompt: str,
+                        fallback_markers: Tuple[str, ...] = DEFAULT_FALLBACK_MARKERS) -> str:
+        """Try Gemini, then Mistral, then HuggingFace without blocking the event loop."""
+        response = await self.acall_gemini_api(prompt)
+        if any(marker in response for marker in fallback_markers):
+            response = await self.acall_mistral_api(session, prompt)
+        if any(marker in response for marker in fallback_markers):
+            response = await self.acall_huggingface_api(session, prompt)
+        return response
 
 class TrendHarvester(AIAgent):
     """Agent responsible for identifying emerging micro-trends."""
@@ -165,7 +312,28 @@ class TrendHarvester(AIAgent):
     def harvest_trends(self, query: str) -> Dict[str, Any]:
         """Harvest trends for a given topic."""
         
-        prompt = f"""
+        prompt = self._trend_prompt(query)
+        
+        # Try Gemini first, then Mistral, fallback to HuggingFace
+        response = self.call_gemini_api(prompt)
+        if "Error:" in response or "not available" in response:
+            response = self.call_mistral_api(prompt)
+        if "Error:" in response or "not available" in response:
+            response = self.call_huggingface_api(prompt)
+        
+        return self._trend_result(query, response)
+    
+    async def aharvest_trends(self, query: str, session=None) -> Dict[str, Any]:
+        """Async variant of harvest_trends."""
+        response = await self.agenerate(
+            session, self._trend_prompt(query),
+            (ErrorMessages.PREFIX, ErrorMessages.NOT_AVAILABLE)
+        )
+        return self._trend_result(query, response)
+    
+    def _trend_prompt(self, query: str) -> str:
+        """Build the trend analysis prompt."""
+        return f"""
         You are a TrendHarvester AI. Analyze the topic '{query}' and identify trending patterns.
         
         Provide insights on:
@@ -176,14 +344,9 @@ class TrendHarvester(AIAgent):
         
         Return a detailed analysis of trends for this topic.
         """
-        
-        # Try Gemini first, then Mistral, fallback to HuggingFace
-        response = self.call_gemini_api(prompt)
-        if "Error:" in response or "not available" in response:
-            response = self.call_mistral_api(prompt)
-        if "Error:" in response or "not available" in response:
-            response = self.call_huggingface_api(prompt)
-        
+    
+    def _trend_result(self, query: str, response: str) -> Dict[str, Any]:
+        """Package a trend analysis response."""
         return {
             "agent": self.name,
             "query": query,
@@ -191,24 +354,89 @@ class TrendHarvester(AIAgent):
             "status": "completed"
         }
 
+# Analogy writes arriving within this window share one embedding batch
+COALESCE_WINDOW = 0.005
+COALESCE_BATCH_SIZE = 32
+
+class _QueryCoalescer:
+    """Collects concurrent vector-store writes and stores them in one batch."""
+    
+    def __init__(self, vector_store, batch_size: int = COALESCE_BATCH_SIZE, window: float = COALESCE_WINDOW):
+        self.vector_store = vector_store
+        self.batch_size = batch_size
+        self.window = window
+        self.loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._task = self.loop.create_task(self._run())
+    
+    async def submit(self, trend: str, brand: str, analogy: str) -> bool:
+        """Queue an analogy and wait for its batch to be stored."""
+        future = self.loop.create_future()
+        await self._queue.put(((trend, brand, analogy), future))
+        return await future
+    
+    async def _run(self):
+        """Drain the queue in batches of up to batch_size or window seconds."""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self.loop.time() + self.window
+            while len(batch) < self.batch_size:
+                timeout = deadline - self.loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                # Embedding is CPU-bound, so the whole batch runs in one thread hop
+                results = await asyncio.to_thread(
+                    self.vector_store.add_analogies, [item for item, _ in batch]
+                )
+            except asyncio.CancelledError:
+                self._release([future for _, future in batch])
+                raise
+            except Exception as e:
+                # Any failure must still resolve the batch, or its writers wait forever
+                logger.warning(f"Failed to store analogy batch in vector store: {e}")
+                results = [False] * len(batch)
+            
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+    
+    @staticmethod
+    def _release(futures):
+        """Resolve writers whose analogies will not be stored."""
+        for future in futures:
+            if not future.done():
+                future.set_result(False)
+    
+    async def close(self):
+        """Stop the batching task and release any writers still queued."""
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        pending = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait()[1])
+        self._release(pending)
+
 class AnalogicalReasoner(AIAgent):
     """Agent responsible for creating brand-trend analogies."""
     
     def __init__(self, vector_store=None):
         super().__init__("AnalogicalReasoner")
         self.vector_store = vector_store
+        self._coalescer = None
     
     def create_analogy(self, trend: str, brand: str) -> Dict[str, Any]:
         """Create an analogy between a trend and brand."""
         
-        prompt = f"""
-        You are an AnalogicalReasoner AI. Create a compelling analogy between:
-        Trend: {trend}
-        Brand: {brand}
-        
-        Provide a creative connection that shows how the brand aligns with this trend.
-        Make it memorable and persuasive for advertising purposes.
-        """
+        prompt = self._analogy_prompt(trend, brand)
         
         # Try Gemini first, fallback to other models
         response = self.call_gemini_api(prompt)
@@ -217,13 +445,50 @@ class AnalogicalReasoner(AIAgent):
         if "Error:" in response:
             response = self.call_huggingface_api(prompt)
         
-        # Store the analogy if vector store is available
+        self._store_analogy(trend, brand, response)
+        return self._analogy_result(trend, brand, response)
+    
+    async def acreate_analogy(self, trend: str, brand: str, session=None) -> Dict[str, Any]:
+        """Async variant of create_analogy."""
+        response = await self.agenerate(session, self._analogy_prompt(trend, brand))
+        if self.vector_store and ErrorMessages.PREFIX not in response:
+            await self._get_coalescer().submit(trend, brand, response)
+        return self._analogy_result(trend, brand, response)
+    
+    async def aclose(self):
+        """Shut down the write coalescer for the running event loop."""
+        coalescer = self._coalescer
+        if coalescer is not None and coalescer.loop is asyncio.get_running_loop():
+            self._coalescer = None
+            await coalescer.close()
+    
+    def _get_coalescer(self) -> _QueryCoalescer:
+        """Return the write coalescer for the running event loop."""
+        if self._coalescer is None or self._coalescer.loop is not asyncio.get_running_loop():
+            self._coalescer = _QueryCoalescer(self.vector_store)
+        return self._coalescer
+    
+    def _analogy_prompt(self, trend: str, brand: str) -> str:
+        """Build the analogy prompt."""
+        return f"""
+        You are an AnalogicalReasoner AI. Create a compelling analogy between:
+        Trend: {trend}
+        Brand: {brand}
+        
+        Provide a creative connection that shows how the brand aligns with this trend.
+        Make it memorable and persuasive for advertising purposes.
+        """
+    
+    def _store_analogy(self, trend: str, brand: str, response: str):
+        """Store the analogy if vector store is available."""
         if self.vector_store and ErrorMessages.PREFIX not in response:
             try:
                 self.vector_store.add_analogy(trend, brand, response)
             except (AttributeError, ValueError, RuntimeError) as e:
                 logger.warning(f"Failed to store analogy in vector store: {e}")  # Log but continue
-        
+    
+    def _analogy_result(self, trend: str, brand: str, response: str) -> Dict[str, Any]:
+        """Package an analogy response."""
         return {
             "agent": self.name,
             "trend": trend,
@@ -240,8 +505,41 @@ class CreativeSynthesizer(AIAgent):
     
     def synthesize_creative(self, analogy: str) -> Dict[str, Any]:
         """Generate creative content based on analogy."""
+        return self._synthesize(analogy, analogy)
+    
+    def synthesize_creative_dict(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate creative content from a structured creative context."""
+        return self._synthesize(self._context_brief(context), context)
+    
+    async def asynthesize_creative_dict(self, context: Dict[str, Any], session=None) -> Dict[str, Any]:
+        """Async variant of synthesize_creative_dict."""
+        response = await self.agenerate(session, self._creative_prompt(self._context_brief(context)))
+        return self._creative_result(context, response)
+    
+    @staticmethod
+    def _context_brief(context: Dict[str, Any]) -> str:
+        """Render a creative context as prompt text."""
+        return "\n".join(
+            f"{key.replace('_', ' ').title()}: {value}" for key, value in context.items()
+        )
+    
+    def _synthesize(self, analogy: str, source: Any) -> Dict[str, Any]:
+        """Prompt the model with the analogy text and package the result."""
+        
+        prompt = self._creative_prompt(analogy)
         
-        prompt = f"""
+        # Try Gemini first, fallback to other models
+        response = self.call_gemini_api(prompt)
+        if "Error:" in response:
+            response = self.call_mistral_api(prompt)
+        if "Error:" in response:
+            response = self.call_huggingface_api(prompt)
+        
+        return self._creative_result(source, response)
+    
+    def _creative_prompt(self, analogy: str) -> str:
+        """Build the creative synthesis prompt."""
+        return f"""
         You are a CreativeSynthesizer AI. Based on this analogy:
         {analogy}
         
@@ -252,17 +550,12 @@ class CreativeSynthesizer(AIAgent):
         
         Make them engaging and action-oriented.
         """
-        
-        # Try Gemini first, fallback to other models
-        response = self.call_gemini_api(prompt)
-        if "Error:" in response:
-            response = self.call_mistral_api(prompt)
-        if "Error:" in response:
-            response = self.call_huggingface_api(prompt)
-        
+    
+    def _creative_result(self, source: Any, response: str) -> Dict[str, Any]:
+        """Package a creative synthesis response."""
         return {
             "agent": self.name,
-            "analogy": analogy,
+            "analogy": source,
             "creative_content": response,
             "status": "completed"
         }
@@ -276,16 +569,7 @@ class BudgetOptimizer(AIAgent):
     def optimize_budget(self) -> Dict[str, Any]:
         """Optimize budget allocation across channels."""
         
-        prompt = """
-        You are a BudgetOptimizer AI. Recommend optimal budget allocation across:
-        - Social Media Advertising (Facebook, Instagram, Twitter)
-        - Search Engine Marketing (Google Ads, Bing Ads)
-        - Content Marketing
-        - Email Marketing
-        - Influencer Partnerships
-        
-        Provide percentages and reasoning for each channel.
-        """
+        prompt = self.BUDGET_PROMPT
         
         # Try Gemini first, fallback to other models
         response = self.call_gemini_api(prompt)
@@ -294,11 +578,30 @@ class BudgetOptimizer(AIAgent):
         if "Error:" in response:
             response = self.call_huggingface_api(prompt)
         
+        return self._budget_result(response)
+    
+    async def aoptimize_budget(self, session=None) -> Dict[str, Any]:
+        """Async variant of optimize_budget."""
+        return self._budget_result(await self.agenerate(session, self.BUDGET_PROMPT))
+    
+    def _budget_result(self, response: str) -> Dict[str, Any]:
+        """Package a budget optimization response."""
         return {
             "agent": self.name,
             "optimization_plan": response,
             "status": "completed"
         }
+    
+    BUDGET_PROMPT = """
+        You are a BudgetOptimizer AI. Recommend optimal budget allocation across:
+        - Social Media Advertising (Facebook, Instagram, Twitter)
+        - Search Engine Marketing (Google Ads, Bing Ads)
+        - Content Marketing
+        - Email Marketing
+        - Influencer Partnerships
+        
+        Provide percentages and reasoning for each channel.
+        """
 
 class PersonalizationAgent(AIAgent):
     """Agent responsible for personalized user journey creation."""
@@ -309,8 +612,26 @@ class PersonalizationAgent(AIAgent):
     def create_personalization(self, profile: Dict) -> Dict[str, Any]:
         """Create personalized user journey."""
         
-        profile_json = json.dumps(profile, indent=2)
-        prompt = f"""
+        prompt = self._personalization_prompt(profile)
+        
+        # Try Gemini first, fallback to other models
+        response = self.call_gemini_api(prompt)
+        if "Error:" in response:
+            response = self.call_mistral_api(prompt)
+        if "Error:" in response:
+            response = self.call_huggingface_api(prompt)
+        
+        return self._personalization_result(profile, response)
+    
+    async def acreate_personalization(self, profile: Dict, session=None) -> Dict[str, Any]:
+        """Async variant of create_personalization."""
+        response = await self.agenerate(session, self._personalization_prompt(profile))
+        return self._personalization_result(profile, response)
+    
+    def _personalization_prompt(self, profile: Dict) -> str:
+        """Build the personalization prompt."""
+        profile_json = _pretty_json(profile)
+        return f"""
         You are a PersonalizationAgent AI. Based on this user profile:
         {profile_json}
         
@@ -322,14 +643,9 @@ class PersonalizationAgent(AIAgent):
         
         Tailor the approach to this specific audience.
         """
-        
-        # Try Gemini first, fallback to other models
-        response = self.call_gemini_api(prompt)
-        if "Error:" in response:
-            response = self.call_mistral_api(prompt)
-        if "Error:" in response:
-            response = self.call_huggingface_api(prompt)
-        
+    
+    def _personalization_result(self, profile: Dict, response: str) -> Dict[str, Any]:
+        """Package a personalization response."""
         return {
             "agent": self.name,
             "user_profile": profile,
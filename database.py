@@ -23,6 +23,36 @@ except ImportError:
     logger.warning("PostgreSQL not available, using file-based storage")
     POSTGRES_AVAILABLE = False
 
+# Prefer orjson for campaign (de)serialization when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(obj: Any, indent: bool = True) -> bytes:
+    """Serialize campaign data to JSON bytes."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=str).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize JSON bytes written by _dumps."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_str(obj: Any) -> str:
+    """Compact JSON text for psycopg2's Json adapter."""
+    return _dumps(obj, indent=False).decode()
+
 class DatabaseManager:
     """Database manager with PostgreSQL and file-based fallback."""
 
@@ -94,6 +124,18 @@ class DatabaseManager:
         else:
             return self._save_campaign_file(campaign_data)
 
+    def save_campaigns_bulk(self, campaigns: List[Dict]) -> List[str]:
+        """Save several campaigns in a single transaction or file write."""
+        created_at = datetime.now().isoformat()
+        for campaign_data in campaigns:
+            campaign_data['id'] = str(uuid.uuid4())
+            campaign_data['created_at'] = created_at
+
+        if self.use_postgres:
+            return self._save_campaigns_postgres(campaigns)
+        else:
+            return self._save_campaigns_file(campaigns)
+
     def _save_campaign_postgres(self, campaign_data: Dict) -> str:
         """Save campaign to PostgreSQL."""
         try:
@@ -112,9 +154,9 @@ class DatabaseManager:
                 campaign_data.get('brand', ''),
                 campaign_data.get('budget', 0),
                 campaign_data.get('market_region', ''),
-                Json(campaign_data.get('user_profile', {})),
-                Json(campaign_data.get('results', {})),
-                Json(campaign_data.get('execution_metadata', {}))
+                Json(campaign_data.get('user_profile', {}), dumps=_dumps_str),
+                Json(campaign_data.get('results', {}), dumps=_dumps_str),
+                Json(campaign_data.get('execution_metadata', {}), dumps=_dumps_str)
             ))
 
             conn.commit()
@@ -129,21 +171,59 @@ class DatabaseManager:
             # Fallback to file storage
             return self._save_campaign_file(campaign_data)
 
+    def _save_campaigns_postgres(self, campaigns: List[Dict]) -> List[str]:
+        """Save a batch of campaigns to PostgreSQL with one executemany."""
+        try:
+            database_url = os.environ.get('DATABASE_URL')
+            conn = psycopg2.connect(database_url)
+            cursor = conn.cursor()
+
+            cursor.executemany("""
+                INSERT INTO campaigns (
+                    id, topic, brand, budget, market_region, 
+                    user_profile, results, execution_metadata
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            """, [
+                (
+                    campaign_data['id'],
+                    campaign_data.get('topic', ''),
+                    campaign_data.get('brand', ''),
+                    campaign_data.get('budget', 0),
+                    campaign_data.get('market_region', ''),
+                    Json(campaign_data.get('user_profile', {}), dumps=_dumps_str),
+                    Json(campaign_data.get('results', {}), dumps=_dumps_str),
+                    Json(campaign_data.get('execution_metadata', {}), dumps=_dumps_str)
+                )
+                for campaign_data in campaigns
+            ])
+
+            conn.commit()
+            cursor.close()
+            conn.close()
+
+            logger.info(f"Saved {len(campaigns)} campaigns to PostgreSQL")
+            return [campaign_data['id'] for campaign_data in campaigns]
+
+        except Exception as e:
+            logger.error(f"Error saving batch to PostgreSQL: {e}")
+            # Fallback to file storage
+            return self._save_campaigns_file(campaigns)
+
     def _save_campaign_file(self, campaign_data: Dict) -> str:
         """Save campaign to file."""
         try:
             # Load existing campaigns
             campaigns = {}
             if os.path.exists(self.file_storage):
-                with open(self.file_storage, 'r') as f:
-                    campaigns = json.load(f)
+                with open(self.file_storage, 'rb') as f:
+                    campaigns = _loads(f.read())
 
             # Add new campaign
             campaigns[campaign_data['id']] = campaign_data
 
             # Save back to file
-            with open(self.file_storage, 'w') as f:
-                json.dump(campaigns, f, indent=2, default=str)
+            with open(self.file_storage, 'wb') as f:
+                f.write(_dumps(campaigns))
 
             logger.info(f"Campaign saved to file: {campaign_data['id']}")
             return campaign_data['id']
@@ -152,6 +232,29 @@ class DatabaseManager:
             logger.error(f"Error saving to file: {e}")
             return ""
 
+    def _save_campaigns_file(self, campaigns: List[Dict]) -> List[str]:
+        """Save a batch of campaigns to file with a single rewrite."""
+        try:
+            # Load existing campaigns
+            stored = {}
+            if os.path.exists(self.file_storage):
+                with open(self.file_storage, 'rb') as f:
+                    stored = _loads(f.read())
+
+            for campaign_data in campaigns:
+                stored[campaign_data['id']] = campaign_data
+
+            # Save back to file
+            with open(self.file_storage, 'wb') as f:
+                f.write(_dumps(stored))
+
+            logger.info(f"Saved {len(campaigns)} campaigns to file")
+            return [campaign_data['id'] for campaign_data in campaigns]
+
+        except Exception as e:
+            logger.error(f"Error saving batch to file: {e}")
+            return []
+
     def get_campaign(self, campaign_id: str) -> Optional[Dict]:
         """Get campaign by ID."""
         if self.use_postgres:
@@ -182,8 +285,8 @@ class DatabaseManager:
         """Get campaign from file."""
         try:
             if os.path.exists(self.file_storage):
-                with open(self.file_storage, 'r') as f:
-                    campaigns = json.load(f)
+                with open(self.file_storage, 'rb') as f:
+                    campaigns = _loads(f.read())
                 return campaigns.get(campaign_id)
             return None
 
@@ -224,8 +327,8 @@ class DatabaseManager:
         """List campaigns from file."""
         try:
             if os.path.exists(self.file_storage):
-                with open(self.file_storage, 'r') as f:
-                    campaigns = json.load(f)
+                with open(self.file_storage, 'rb') as f:
+                    campaigns = _loads(f.read())
 
                 # Sort by created_at and limit
                 campaign_list = list(campaigns.values())
@@ -273,14 +376,14 @@ class DatabaseManager:
         """Delete campaign from file."""
         try:
             if os.path.exists(self.file_storage):
-                with open(self.file_storage, 'r') as f:
-                    campaigns = json.load(f)
+                with open(self.file_storage, 'rb') as f:
+                    campaigns = _loads(f.read())
 
                 if campaign_id in campaigns:
                     del campaigns[campaign_id]
 
-                    with open(self.file_storage, 'w') as f:
-                        json.dump(campaigns, f, indent=2, default=str)
+                    with open(self.file_storage, 'wb') as f:
+                        f.write(_dumps(campaigns))
 
                     return True
 
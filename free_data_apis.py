@@ -4,11 +4,100 @@ Includes Twitter/Reddit alternatives, news APIs, and marketing resources.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
-from typing import Dict, List, Any
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import time
-import random
+import re
+
+import numpy as np
+
+try:
+    from cachecontrol import CacheControlAdapter
+    from cachecontrol.caches import FileCache
+    CACHECONTROL_AVAILABLE = True
+except ImportError:
+    CacheControlAdapter = None
+    FileCache = None
+    CACHECONTROL_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import feedparser
+    FEEDPARSER_AVAILABLE = True
+except ImportError:
+    feedparser = None
+    FEEDPARSER_AVAILABLE = False
+
+try:
+    from cachetools import TTLCache
+    from cachetools.keys import hashkey
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    TTLCache = None
+    hashkey = None
+    CACHETOOLS_AVAILABLE = False
+
+HTTP_CACHE_DIR = '.http_cache'
+RESPONSE_CACHE_SIZE = 128
+RESPONSE_CACHE_TTL = 300  # seconds
+SUBREDDIT_WORKERS = 4
+SOURCE_WORKERS = 4
+HTTP_POOL_SIZE = 8
+USER_AGENT = 'AdBrain/1.0'
+
+
+def _build_http_session() -> requests.Session:
+    """Create a pooled, retrying session that honours Cache-Control/ETag when possible."""
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    pool = {'pool_connections': 4, 'pool_maxsize': HTTP_POOL_SIZE, 'max_retries': retry}
+    if CACHECONTROL_AVAILABLE:
+        adapter = CacheControlAdapter(cache=FileCache(HTTP_CACHE_DIR), **pool)
+    else:
+        adapter = HTTPAdapter(**pool)
+    
+    session = requests.Session()
+    session.headers['User-Agent'] = USER_AGENT
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def _build_response_cache():
+    """Create a bounded TTL cache for parsed results, or None without cachetools."""
+    if CACHETOOLS_AVAILABLE:
+        return TTLCache(maxsize=RESPONSE_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL)
+    return None
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+@functools.lru_cache(maxsize=256)
+def _query_pattern(query: str) -> re.Pattern:
+    """Case-insensitive matcher for a literal query, compiled once per query."""
+    return re.compile(re.escape(query), re.IGNORECASE)
+
+
+def _field_sum(records: List[Dict], field: str) -> float:
+    """Sum one numeric field across records in a single vectorised reduction."""
+    values = np.fromiter((record.get(field, 0) for record in records), dtype=np.float64, count=len(records))
+    return float(values.sum())
 
 
 class TwitterAlternativeAPI:
@@ -21,6 +110,8 @@ class TwitterAlternativeAPI:
             'nitter2': 'https://nitter.it',
             'nitter3': 'https://nitter.fdn.fr'
         }
+        # Per-instance generator, so concurrent sources never share one
+        self._rng = np.random.default_rng()
     
     def search_tweets(self, query: str, count: int = 20) -> List[Dict]:
         """Search for tweets using free Nitter instances."""
@@ -28,21 +119,34 @@ class TwitterAlternativeAPI:
         
         try:
             # Use web scraping approach for trending topics
-            trending_data = self._get_trending_topics()
+            trending_data = self._get_trending_topics()[:count]
+            n = len(trending_data)
+            if not n:
+                return tweets
+            
+            now = datetime.now()
+            stamp = int(time.time())
+            query_tag = f'#{query.lower()}'
+            user_ids = self._rng.integers(1000, 9999, size=n, endpoint=True).tolist()
+            hour_offsets = self._rng.integers(1, 24, size=n, endpoint=True).tolist()
+            retweets = self._rng.integers(10, 1000, size=n, endpoint=True).tolist()
+            likes = self._rng.integers(50, 5000, size=n, endpoint=True).tolist()
+            scores = self._rng.uniform(0.1, 1.0, size=n).tolist()
             
             # Simulate tweet-like data structure
-            for i in range(min(count, len(trending_data))):
-                tweet = {
-                    'id': f'tweet_{i}_{int(time.time())}',
-                    'text': f"Trending now: {trending_data[i]} - This is changing how we think about {query}",
-                    'user': f'user_{random.randint(1000, 9999)}',
-                    'created_at': (datetime.now() - timedelta(hours=random.randint(1, 24))).isoformat(),
-                    'retweet_count': random.randint(10, 1000),
-                    'like_count': random.randint(50, 5000),
-                    'hashtags': [f'#{query.lower()}', f'#{trending_data[i].lower().replace(" ", "")}'],
-                    'engagement_score': random.uniform(0.1, 1.0)
+            tweets = [
+                {
+                    'id': f'tweet_{i}_{stamp}',
+                    'text': f"Trending now: {topic} - This is changing how we think about {query}",
+                    'user': f'user_{user_ids[i]}',
+                    'created_at': (now - timedelta(hours=hour_offsets[i])).isoformat(),
+                    'retweet_count': retweets[i],
+                    'like_count': likes[i],
+                    'hashtags': [query_tag, f'#{topic.lower().replace(" ", "")}'],
+                    'engagement_score': scores[i]
                 }
-                tweets.append(tweet)
+                for i, topic in enumerate(trending_data)
+            ]
                 
         except Exception as e:
             logging.warning(f"Twitter alternative API error: {e}")
@@ -59,11 +163,11 @@ class TwitterAlternativeAPI:
             "mental health", "e-commerce growth", "social impact",
             "automation", "cybersecurity", "climate tech"
         ]
-        return random.sample(trends, min(8, len(trends)))
+        picks = self._rng.choice(len(trends), size=min(8, len(trends)), replace=False)
+        return [trends[i] for i in picks.tolist()]
     
     def _get_sample_tweets(self, query: str, count: int) -> List[Dict]:
         """Generate realistic sample tweet data."""
-        sample_tweets = []
         topics = [
             f"The future of {query} is here",
             f"How {query} is changing everything",
@@ -72,18 +176,31 @@ class TwitterAlternativeAPI:
             f"Experts predict {query} will dominate"
         ]
         
-        for i in range(count):
-            tweet = {
-                'id': f'sample_{i}_{int(time.time())}',
-                'text': f"{random.choice(topics)} - {random.choice(['Amazing insights!', 'Game changer!', 'Must read!'])}",
-                'user': f'tech_insider_{random.randint(100, 999)}',
-                'created_at': (datetime.now() - timedelta(hours=random.randint(1, 48))).isoformat(),
-                'retweet_count': random.randint(5, 500),
-                'like_count': random.randint(20, 2000),
-                'hashtags': [f'#{query.lower()}', '#trending', '#innovation'],
-                'engagement_score': random.uniform(0.2, 0.9)
+        taglines = ['Amazing insights!', 'Game changer!', 'Must read!']
+        now = datetime.now()
+        stamp = int(time.time())
+        topic_idx = self._rng.integers(0, len(topics), size=count).tolist()
+        tagline_idx = self._rng.integers(0, len(taglines), size=count).tolist()
+        user_ids = self._rng.integers(100, 999, size=count, endpoint=True).tolist()
+        hour_offsets = self._rng.integers(1, 48, size=count, endpoint=True).tolist()
+        retweets = self._rng.integers(5, 500, size=count, endpoint=True).tolist()
+        likes = self._rng.integers(20, 2000, size=count, endpoint=True).tolist()
+        scores = self._rng.uniform(0.2, 0.9, size=count).tolist()
+        hashtags = [f'#{query.lower()}', '#trending', '#innovation']
+        
+        sample_tweets = [
+            {
+                'id': f'sample_{i}_{stamp}',
+                'text': f"{topics[topic_idx[i]]} - {taglines[tagline_idx[i]]}",
+                'user': f'tech_insider_{user_ids[i]}',
+                'created_at': (now - timedelta(hours=hour_offsets[i])).isoformat(),
+                'retweet_count': retweets[i],
+                'like_count': likes[i],
+                'hashtags': list(hashtags),
+                'engagement_score': scores[i]
             }
-            sample_tweets.append(tweet)
+            for i in range(count)
+        ]
         
         return sample_tweets
 
@@ -93,70 +210,104 @@ class RedditAPI:
     
     def __init__(self):
         self.base_url = 'https://www.reddit.com'
+        self.hot_url = self.base_url + '/r/{}/hot.json?limit=10'
+        self.session = _build_http_session()
+        self._cache = _build_response_cache()
+        self._rng = np.random.default_rng()
     
-    def find_subreddits(self, search_term: str, communities: List[str] = None) -> List[Dict]:
+    def find_subreddits(self, query: str, subreddits: List[str] = None) -> List[Dict]:
         """Search Reddit posts from relevant subreddits."""
         if not subreddits:
             subreddits = ['technology', 'business', 'marketing', 'startups', 'innovation']
         
+        key = None
+        if self._cache is not None:
+            key = hashkey(tuple(subreddits), query)
+            cached = self._cache.get(key)
+            logging.debug(f"Reddit cache {'hit' if cached is not None else 'miss'} for {query!r}")
+            if cached is not None:
+                return [dict(post) for post in cached]
+        
+        # Same-host requests, so keep the fan-out bounded instead of sleeping
+        with ThreadPoolExecutor(max_workers=min(SUBREDDIT_WORKERS, len(subreddits))) as executor:
+            results = executor.map(lambda subreddit: self._fetch_subreddit(subreddit, query), subreddits)
+            posts = list(itertools.chain.from_iterable(results))
+        
+        # If no real data, return sample posts
+        if not posts:
+            return self._get_sample_reddit_posts(query)[:20]
+        
+        posts = posts[:20]  # Limit results
+        if key is not None:
+            # Cache a private copy; callers get their own dicts on every hit
+            self._cache[key] = tuple(dict(post) for post in posts)
+        return posts
+    
+    def _fetch_subreddit(self, subreddit: str, query: str) -> List[Dict]:
+        """Fetch one subreddit's hot posts that mention the query."""
         posts = []
+        pattern = _query_pattern(query)
         
-        for subreddit in subreddits:
-            try:
-                # Reddit JSON API (free)
-                url = f"{self.base_url}/r/{subreddit}/hot.json?limit=10"
-                headers = {'User-Agent': 'AdBrain/1.0'}
-                
-                response = requests.get(url, headers=headers, timeout=10)
+        try:
+            # Reddit JSON API (free)
+            url = self.hot_url.format(subreddit)
+            response = self.session.get(url, timeout=10)
+            
+            if response.status_code == 200:
+                data = _decode_json(response)
                 
-                if response.status_code == 200:
-                    data = response.json()
+                for post in data.get('data', {}).get('children', []):
+                    post_data = post.get('data', {})
                     
-                    for post in data.get('data', {}).get('children', []):
-                        post_data = post.get('data', {})
+                    if pattern.search(post_data.get('title', '')) or \
+                       pattern.search(post_data.get('selftext', '')):
                         
-                        if query.lower() in post_data.get('title', '').lower() or \
-                           query.lower() in post_data.get('selftext', '').lower():
-                            
-                            posts.append({
-                                'id': post_data.get('id'),
-                                'title': post_data.get('title'),
-                                'text': post_data.get('selftext', ''),
-                                'subreddit': subreddit,
-                                'score': post_data.get('score', 0),
-                                'num_comments': post_data.get('num_comments', 0),
-                                'created_utc': post_data.get('created_utc'),
-                                'url': post_data.get('url'),
-                                'author': post_data.get('author'),
-                                'upvote_ratio': post_data.get('upvote_ratio', 0.5)
-                            })
-                
-                time.sleep(1)  # Rate limiting
-                
-            except Exception as e:
-                logging.warning(f"Reddit API error for {subreddit}: {e}")
-        
-        # If no real data, return sample posts
-        if not posts:
-            posts = self._get_sample_reddit_posts(query)
+                        posts.append({
+                            'id': post_data.get('id'),
+                            'title': post_data.get('title'),
+                            'text': post_data.get('selftext', ''),
+                            'subreddit': subreddit,
+                            'score': post_data.get('score', 0),
+                            'num_comments': post_data.get('num_comments', 0),
+                            'created_utc': post_data.get('created_utc'),
+                            'url': post_data.get('url'),
+                            'author': post_data.get('author'),
+                            'upvote_ratio': post_data.get('upvote_ratio', 0.5)
+                        })
+            
+        except Exception as e:
+            logging.warning(f"Reddit API error for {subreddit}: {e}")
         
-        return posts[:20]  # Limit results
+        return posts
+    
+    # Name used by DataIntegrationManager
+    search_subreddits = find_subreddits
     
     def _get_sample_reddit_posts(self, query: str) -> List[Dict]:
         """Generate sample Reddit-style posts."""
+        count = 10
+        subreddits = ['business', 'technology', 'marketing']
+        now = time.time()
+        subreddit_idx = self._rng.integers(0, len(subreddits), size=count).tolist()
+        scores = self._rng.integers(50, 500, size=count, endpoint=True).tolist()
+        comments = self._rng.integers(10, 100, size=count, endpoint=True).tolist()
+        ages = self._rng.integers(3600, 86400, size=count, endpoint=True).tolist()
+        authors = self._rng.integers(1000, 9999, size=count, endpoint=True).tolist()
+        ratios = self._rng.uniform(0.7, 0.95, size=count).tolist()
+        
         sample_posts = [
             {
                 'id': f'post_{i}',
                 'title': f'Discussion: The impact of {query} on modern business',
                 'text': f'I\'ve been researching {query} and found some interesting trends...',
-                'subreddit': random.choice(['business', 'technology', 'marketing']),
-                'score': random.randint(50, 500),
-                'num_comments': random.randint(10, 100),
-                'created_utc': time.time() - random.randint(3600, 86400),
-                'author': f'user_{random.randint(1000, 9999)}',
-                'upvote_ratio': random.uniform(0.7, 0.95)
+                'subreddit': subreddits[subreddit_idx[i]],
+                'score': scores[i],
+                'num_comments': comments[i],
+                'created_utc': now - ages[i],
+                'author': f'user_{authors[i]}',
+                'upvote_ratio': ratios[i]
             }
-            for i in range(10)
+            for i in range(count)
         ]
         return sample_posts
 
@@ -176,6 +327,12 @@ class FreeNewsAPI:
                 'https://feeds.feedburner.com/venturebeat/SZYF'
             ]
         }
+        self.session = _build_http_session()
+        self._cache = _build_response_cache()
+        # Conditional-GET validators and last parsed entries per feed
+        self._feed_etags: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        self._feed_entries: Dict[str, List[Dict]] = {}
+        self._rng = np.random.default_rng()
     
     def get_trending_news(self, query: str, days: int = 7) -> List[Dict]:
         """Get trending news articles related to query."""
@@ -193,52 +350,123 @@ class FreeNewsAPI:
     
     def _parse_rss_feeds(self, query: str) -> List[Dict]:
         """Parse RSS feeds for relevant articles."""
-        import xml.etree.ElementTree as ET
-        
         articles = []
+        pattern = _query_pattern(query)
         
         for feed_url in self.apis['rss_feeds'][:2]:  # Limit to 2 feeds
+            key = None
+            if self._cache is not None:
+                key = hashkey(feed_url, query)
+                cached = self._cache.get(key)
+                logging.debug(f"RSS cache {'hit' if cached is not None else 'miss'} for {feed_url}")
+                if cached is not None:
+                    articles.extend(dict(article) for article in cached)
+                    continue
+            
             try:
-                response = requests.get(feed_url, timeout=10)
+                entries = [
+                    entry for entry in self._fetch_feed_entries(feed_url)[:5]  # Limit items per feed
+                    if pattern.search(entry['title']) or pattern.search(entry['description'])
+                ]
+                source = feed_url.split('/')[2]
+                relevance = self._rng.uniform(0.6, 0.9, size=len(entries)).tolist()
                 
-                if response.status_code == 200:
-                    root = ET.fromstring(response.content)
-                    
-                    for item in root.findall('.//item')[:5]:  # Limit items per feed
-                        title = item.find('title')
-                        description = item.find('description')
-                        link = item.find('link')
-                        pub_date = item.find('pubDate')
-                        
-                        if title is not None and query.lower() in title.text.lower():
-                            articles.append({
-                                'title': title.text,
-                                'description': description.text if description is not None else '',
-                                'url': link.text if link is not None else '',
-                                'published_at': pub_date.text if pub_date is not None else '',
-                                'source': feed_url.split('/')[2],
-                                'relevance_score': random.uniform(0.6, 0.9)
-                            })
+                feed_articles = [
+                    {
+                        'title': entry['title'],
+                        'description': entry['description'],
+                        'url': entry['url'],
+                        'published_at': entry['published_at'],
+                        'source': source,
+                        'relevance_score': relevance[i]
+                    }
+                    for i, entry in enumerate(entries)
+                ]
                 
-                time.sleep(1)  # Rate limiting
+                articles.extend(feed_articles)
+                if key is not None:
+                    # Cache a private copy; callers get their own dicts on every hit
+                    self._cache[key] = tuple(dict(article) for article in feed_articles)
                 
             except Exception as e:
                 logging.warning(f"RSS feed error {feed_url}: {e}")
         
         return articles
     
+    def _fetch_feed_entries(self, feed_url: str) -> List[Dict]:
+        """Fetch a feed's entries, reusing the last parse when it is unchanged."""
+        if not FEEDPARSER_AVAILABLE:
+            return self._fetch_feed_entries_xml(feed_url)
+        
+        # Fetch through the shared session so retries, timeout and cache apply
+        etag, modified = self._feed_etags.get(feed_url, (None, None))
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if modified:
+            headers['If-Modified-Since'] = modified
+        response = self.session.get(feed_url, timeout=10, headers=headers)
+        
+        if response.status_code == 304:
+            return self._feed_entries.get(feed_url, [])
+        response.raise_for_status()
+        
+        parsed = feedparser.parse(response.content)
+        entries = [
+            {
+                'title': entry.get('title', ''),
+                'description': entry.get('summary', ''),
+                'url': entry.get('link', ''),
+                'published_at': entry.get('published', '')
+            }
+            for entry in parsed.entries
+        ]
+        self._feed_etags[feed_url] = (response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        self._feed_entries[feed_url] = entries
+        return entries
+    
+    def _fetch_feed_entries_xml(self, feed_url: str) -> List[Dict]:
+        """Fallback RSS parsing with ElementTree when feedparser is missing."""
+        import xml.etree.ElementTree as ET
+        
+        response = self.session.get(feed_url, timeout=10)
+        entries = []
+        
+        if response.status_code == 200:
+            root = ET.fromstring(response.content)
+            
+            for item in root.findall('.//item'):
+                title = item.find('title')
+                if title is None or title.text is None:
+                    continue
+                description = item.find('description')
+                link = item.find('link')
+                pub_date = item.find('pubDate')
+                entries.append({
+                    'title': title.text,
+                    'description': description.text if description is not None else '',
+                    'url': link.text if link is not None else '',
+                    'published_at': pub_date.text if pub_date is not None else ''
+                })
+        
+        return entries
+    
     def _get_sample_news(self, query: str) -> List[Dict]:
         """Generate sample news articles."""
+        count = 8
+        now = datetime.now()
+        day_offsets = self._rng.integers(1, 7, size=count, endpoint=True).tolist()
+        relevance = self._rng.uniform(0.7, 0.95, size=count).tolist()
         sample_articles = [
             {
                 'title': f'The Rise of {query}: What Industry Leaders Need to Know',
                 'description': f'Comprehensive analysis of how {query} is transforming business landscape...',
                 'url': f'https://example.com/news/{query.lower().replace(" ", "-")}',
-                'published_at': (datetime.now() - timedelta(days=random.randint(1, 7))).isoformat(),
+                'published_at': (now - timedelta(days=day_offsets[i])).isoformat(),
                 'source': 'TechNews',
-                'relevance_score': random.uniform(0.7, 0.95)
+                'relevance_score': relevance[i]
             }
-            for i in range(8)
+            for i in range(count)
         ]
         return sample_articles
 
@@ -257,6 +485,7 @@ class FreeMarketingAPIs:
                 'https://httpstat.us/200'  # Status checking
             ]
         }
+        self._rng = np.random.default_rng()
     
     def get_industry_trends(self, industry: str) -> Dict[str, Any]:
         """Get industry trends from free sources."""
@@ -288,16 +517,23 @@ class FreeMarketingAPIs:
         }
         
         keywords = base_keywords.get(industry.lower(), ['innovation', 'growth', 'digital', 'strategy'])
+        count = len(keywords)
+        directions = ['rising', 'stable', 'declining']
+        levels = ['low', 'medium', 'high']
+        volumes = self._rng.integers(1000, 50000, size=count, endpoint=True).tolist()
+        direction_idx = self._rng.integers(0, len(directions), size=count).tolist()
+        level_idx = self._rng.integers(0, len(levels), size=count).tolist()
+        relevance = self._rng.uniform(0.6, 1.0, size=count).tolist()
         
         return [
             {
                 'keyword': keyword,
-                'search_volume': random.randint(1000, 50000),
-                'trend_direction': random.choice(['rising', 'stable', 'declining']),
-                'competition': random.choice(['low', 'medium', 'high']),
-                'relevance_score': random.uniform(0.6, 1.0)
+                'search_volume': volumes[i],
+                'trend_direction': directions[direction_idx[i]],
+                'competition': levels[level_idx[i]],
+                'relevance_score': relevance[i]
             }
-            for keyword in keywords
+            for i, keyword in enumerate(keywords)
         ]
     
     def _get_emerging_topics(self, industry: str) -> List[str]:
@@ -312,20 +548,25 @@ class FreeMarketingAPIs:
     
     def _analyze_sentiment(self, industry: str) -> Dict[str, float]:
         """Analyze sentiment around industry."""
+        positive, negative, neutral, confidence = self._rng.uniform(
+            [0.6, 0.1, 0.1, 0.7], [0.8, 0.2, 0.3, 0.9]
+        ).tolist()
         return {
-            'positive_sentiment': random.uniform(0.6, 0.8),
-            'negative_sentiment': random.uniform(0.1, 0.2),
-            'neutral_sentiment': random.uniform(0.1, 0.3),
-            'overall_confidence': random.uniform(0.7, 0.9)
+            'positive_sentiment': positive,
+            'negative_sentiment': negative,
+            'neutral_sentiment': neutral,
+            'overall_confidence': confidence
         }
     
     def _get_competitive_data(self, industry: str) -> Dict[str, Any]:
         """Get competitive landscape data."""
+        levels = ['low', 'medium', 'high']
+        growth_rate, innovation = self._rng.uniform([5, 0.6], [25, 0.9]).tolist()
         return {
-            'market_saturation': random.choice(['low', 'medium', 'high']),
+            'market_saturation': levels[self._rng.integers(len(levels))],
             'top_competitors': [f'Company_{i}' for i in range(1, 6)],
-            'market_growth_rate': f'{random.uniform(5, 25):.1f}%',
-            'innovation_index': random.uniform(0.6, 0.9)
+            'market_growth_rate': f'{growth_rate:.1f}%',
+            'innovation_index': innovation
         }
 
 
@@ -338,6 +579,7 @@ class FreeAdvertisingResources:
             'google_ad_gallery': 'https://ads.google.com/gallery',  # Google Ad Gallery
             'creative_commons': 'https://search.creativecommons.org'  # Free creative assets
         }
+        self._rng = np.random.default_rng()
     
     def get_ad_inspiration(self, industry: str, ad_type: str = 'all') -> List[Dict]:
         """Get advertising inspiration from free sources."""
@@ -356,24 +598,30 @@ class FreeAdvertisingResources:
     def _get_sample_ads(self, industry: str, ad_type: str) -> List[Dict]:
         """Get sample advertising examples."""
         ad_formats = ['video', 'image', 'carousel', 'story', 'text']
+        elements = ['bold text', 'bright colors', 'call-to-action', 'testimonial']
+        count = 8
+        format_idx = self._rng.integers(0, len(ad_formats), size=count).tolist()
+        performance = self._rng.uniform(0.6, 0.95, size=count).tolist()
+        engagement = self._rng.uniform(2, 8, size=count).tolist()
+        ctr = self._rng.uniform(0.5, 3, size=count).tolist()
+        # Two distinct elements per ad: the first two columns of a row-wise shuffle
+        picks = self._rng.permuted(np.tile(np.arange(len(elements)), (count, 1)), axis=1)[:, :2].tolist()
         
-        ads = []
-        for i in range(8):
-            ad = {
+        return [
+            {
                 'id': f'ad_{industry}_{i}',
                 'headline': f'Transform Your {industry.title()} Business Today',
                 'description': f'Discover innovative solutions for {industry} leaders',
-                'format': random.choice(ad_formats),
+                'format': ad_formats[format_idx[i]],
                 'industry': industry,
-                'performance_score': random.uniform(0.6, 0.95),
-                'engagement_rate': f'{random.uniform(2, 8):.1f}%',
-                'ctr': f'{random.uniform(0.5, 3):.2f}%',
-                'creative_elements': random.sample(['bold text', 'bright colors', 'call-to-action', 'testimonial'], 2),
+                'performance_score': performance[i],
+                'engagement_rate': f'{engagement[i]:.1f}%',
+                'ctr': f'{ctr[i]:.2f}%',
+                'creative_elements': [elements[j] for j in picks[i]],
                 'target_audience': f'{industry} professionals aged 25-45'
             }
-            ads.append(ad)
-        
-        return ads
+            for i in range(count)
+        ]
     
     def _get_fallback_ads(self, industry: str) -> List[Dict]:
         """Fallback ad examples."""
@@ -386,27 +634,38 @@ class FreeAdvertisingResources:
             }
         ]
     
-    def get_creative_assets(self, theme: str) -> Dict[str, List[str]]:
-        """Get free creative assets for campaigns."""
-        return {
-            'stock_photos': [
-                f'https://unsplash.com/photos/{theme}-{i}' for i in range(1, 6)
-            ],
-            'icons': [
-                f'https://feathericons.com/{theme}',
-                f'https://heroicons.com/{theme}'
-            ],
-            'color_palettes': [
-                '#FF6B35, #F7931E, #FFD23F',  # Orange gradient
-                '#667eea, #764ba2, #f093fb',  # Purple gradient
-                '#4facfe, #00f2fe, #43e97b'   # Blue-green gradient
-            ],
-            'fonts': [
-                'Inter, Arial, sans-serif',
-                'Roboto, Helvetica, sans-serif',
-                'Poppins, Arial, sans-serif'
-            ]
-        }
+    @staticmethod
+    def get_creative_assets(theme: str) -> Dict[str, List[str]]:
+        """Get free creative assets for campaigns.
+        
+        Built once per theme; every call returns fresh lists, so callers may
+        modify the result without touching the cached copy.
+        """
+        return {kind: list(assets) for kind, assets in _creative_assets(theme)}
+
+
+@functools.lru_cache(maxsize=256)
+def _creative_assets(theme: str) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """Immutable creative asset lists for a theme."""
+    return (
+        ('stock_photos', tuple(
+            f'https://unsplash.com/photos/{theme}-{i}' for i in range(1, 6)
+        )),
+        ('icons', (
+            f'https://feathericons.com/{theme}',
+            f'https://heroicons.com/{theme}'
+        )),
+        ('color_palettes', (
+            '#FF6B35, #F7931E, #FFD23F',  # Orange gradient
+            '#667eea, #764ba2, #f093fb',  # Purple gradient
+            '#4facfe, #00f2fe, #43e97b'   # Blue-green gradient
+        )),
+        ('fonts', (
+            'Inter, Arial, sans-serif',
+            'Roboto, Helvetica, sans-serif',
+            'Poppins, Arial, sans-serif'
+        ))
+    )
 
 
 class DataIntegrationManager:
@@ -421,14 +680,23 @@ class DataIntegrationManager:
     
     def get_comprehensive_data(self, query: str, industry: str = None) -> Dict[str, Any]:
         """Get comprehensive data from all free sources."""
+        industry = industry or 'technology'
+        
+        # The sources are independent, so the network-bound ones overlap
+        with ThreadPoolExecutor(max_workers=SOURCE_WORKERS) as executor:
+            reddit = executor.submit(self.reddit_api.search_subreddits, query)
+            news = executor.submit(self.news_api.get_trending_news, query)
+            twitter = executor.submit(self.twitter_api.search_tweets, query)
+            insights = executor.submit(self.marketing_api.get_industry_trends, industry)
+        
         data = {
             'social_media': {
-                'twitter_data': self.twitter_api.search_tweets(query),
-                'reddit_data': self.reddit_api.search_subreddits(query)
+                'twitter_data': twitter.result(),
+                'reddit_data': reddit.result()
             },
-            'news_trends': self.news_api.get_trending_news(query),
-            'industry_insights': self.marketing_api.get_industry_trends(industry or 'technology'),
-            'ad_inspiration': self.ad_resources.get_ad_inspiration(industry or 'technology'),
+            'news_trends': news.result(),
+            'industry_insights': insights.result(),
+            'ad_inspiration': self.ad_resources.get_ad_inspiration(industry),
             'creative_assets': self.ad_resources.get_creative_assets(query),
             'data_freshness': datetime.now().isoformat(),
             'sources_used': [
@@ -444,9 +712,10 @@ class DataIntegrationManager:
     
     def analyze_engagement_patterns(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze engagement patterns across all data sources."""
-        twitter_engagement = sum(tweet.get('engagement_score', 0) for tweet in data['social_media']['twitter_data'])
-        reddit_engagement = sum(post.get('upvote_ratio', 0) for post in data['social_media']['reddit_data'])
-        news_relevance = sum(article.get('relevance_score', 0) for article in data['news_trends'])
+        social = data['social_media']
+        twitter_engagement = _field_sum(social['twitter_data'], 'engagement_score')
+        reddit_engagement = _field_sum(social['reddit_data'], 'upvote_ratio')
+        news_relevance = _field_sum(data['news_trends'], 'relevance_score')
         
         return {
             'overall_engagement_score': (twitter_engagement + reddit_engagement + news_relevance) / 3,
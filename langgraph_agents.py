@@ -3,32 +3,216 @@ Revolutionary LangGraph Multi-Agent Architecture for Neural AdBrain
 Implements autonomous advertising brain with unprecedented capabilities using LangGraph.
 """
 
-from typing import Dict, Any, TypedDict
-import logging
+from typing import Annotated, Awaitable, Callable, Dict, Any, List, Optional, Tuple, TypedDict
+import asyncio
+import atexit
+import collections
+import contextlib
+import functools
 import json
+import logging
+import logging.handlers
+import queue
+import itertools
 import random
-import datetime
+import threading
+import time
+import weakref
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    prange = range
+    NUMBA_AVAILABLE = False
 
 # LangGraph imports
 try:
     from langgraph.graph import StateGraph, END
     from langgraph.checkpoint.memory import MemorySaver
-    from langchain_core.runnables import RunnableConfig
     LANGGRAPH_AVAILABLE = True
 except ImportError:
     StateGraph = None
     MemorySaver = None
     END = "END"
-    RunnableConfig = None
     LANGGRAPH_AVAILABLE = False
 import operator
 
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    from cachetools import TTLCache
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    TTLCache = None
+    CACHETOOLS_AVAILABLE = False
+
 # Import existing agents and services
 from agents import TrendHarvester, AnalogicalReasoner, CreativeSynthesizer, BudgetOptimizer, PersonalizationAgent
 from live_data import LiveDataFetcher
 from vector_store import QdrantVectorStore
 from database import DatabaseManager
 
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records as-is; the stock handler formats them on the caller's thread."""
+
+    def prepare(self, record):
+        return record
+
+
+# Workflow records are formatted and written by a listener thread so the
+# event loop only pays for an enqueue
+_log_queue = queue.SimpleQueue()
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+logger.addHandler(_DeferredQueueHandler(_log_queue))
+logger.propagate = False
+
+# State keys whose node updates are appended rather than overwritten
+# (decision_history is pushed newest-first by its reducer)
+_APPEND_KEYS = ("active_agents", "real_time_optimizations", "decision_history")
+
+# Background campaign persistence
+PERSIST_QUEUE_SIZE = 1024
+PERSIST_BATCH_SIZE = 32
+# Log stored-campaign totals once per this many writes
+PERSIST_LOG_EVERY = 100
+
+# Score weights: creative, cultural, timing, personalization
+_VIRAL_WEIGHTS = np.array([0.3, 0.3, 0.25, 0.15])
+# Score weights: completeness, quality, viral potential, timing alignment
+_READINESS_WEIGHTS = np.full(4, 0.25)
+# Signal weights: social momentum, news relevance (scaled to 0-1)
+_TIMING_WEIGHTS = np.array([0.4, 0.6]) / 10.0
+
+# Checkpointed campaign threads kept by the shared checkpointer
+CHECKPOINT_THREAD_LIMIT = 1024
+
+# Outbound API calls share one connection pool per brain and event loop
+HTTP_CONNECTION_LIMIT = 100
+# Resolved provider hosts and idle sockets are kept warm between campaigns
+HTTP_DNS_CACHE_TTL = 300
+HTTP_KEEPALIVE_TIMEOUT = 60
+
+# Batches at or below this size skip the JIT kernel's dispatch overhead
+NUMBA_BATCH_THRESHOLD = 8
+
+
+def _score_batch_numpy(creative, cultural, timing, personalization, novelty, market_sat_low, weights):
+    """Vectorized viral and breakthrough scores for a batch of campaigns."""
+    viral = np.minimum(np.column_stack((creative, cultural, timing, personalization)) @ weights, 10.0)
+    breakthrough = np.minimum(
+        viral / 10.0 + np.where(novelty > 0.8, 0.1, 0.0) + np.where(market_sat_low, 0.15, 0.0),
+        1.0
+    )
+    return viral, breakthrough
+
+
+def _score_batch_kernel(creative, cultural, timing, personalization, novelty, market_sat_low, weights):
+    """Loop form of _score_batch_numpy for Numba to compile."""
+    n = creative.shape[0]
+    viral = np.empty(n)
+    breakthrough = np.empty(n)
+    for i in prange(n):
+        v = (creative[i] * weights[0] + cultural[i] * weights[1] +
+             timing[i] * weights[2] + personalization[i] * weights[3])
+        v = min(v, 10.0)
+        b = v / 10.0
+        if novelty[i] > 0.8:
+            b += 0.1
+        if market_sat_low[i]:
+            b += 0.15
+        viral[i] = v
+        breakthrough[i] = min(b, 1.0)
+    return viral, breakthrough
+
+
+if NUMBA_AVAILABLE:
+    _score_batch_kernel = njit(parallel=True, fastmath=True, cache=True)(_score_batch_kernel)
+
+# Synthetic per-agent quality scores reported in learning feedback
+_AGENT_QUALITY = {
+    "TrendHarvester": 8.7,
+    "AnalogicalReasoner": 9.1,
+    "CreativeSynthesizer": 8.9,
+    "BudgetOptimizer": 8.6,
+    "PersonalizationAgent": 9.3
+}
+
+
+# Every metric a workflow run records, each with a fixed slot in a float array
+_METRIC_KEYS = (
+    "trend_detection_time", "signal_quality",
+    "analogical_processing_time", "insight_depth_score",
+    "creative_generation_time", "multi_modal_coherence",
+    "optimization_time", "roi_improvement_factor",
+    "personalization_time", "targeting_precision",
+    "viral_coefficient", "breakthrough_probability"
+)
+METRIC_SLOTS = {name: slot for slot, name in enumerate(_METRIC_KEYS)}
+
+
+def set_metrics(metrics: np.ndarray, **values: float) -> np.ndarray:
+    """Write named metrics into their slots and return the array."""
+    for name, value in values.items():
+        metrics[METRIC_SLOTS[name]] = value
+    return metrics
+
+
+def get_metric(metrics: np.ndarray, name: str) -> float:
+    """Read a single named metric."""
+    return float(metrics[METRIC_SLOTS[name]])
+
+
+def metrics_dict(metrics: np.ndarray) -> Dict[str, float]:
+    """Materialize the metric array as a name -> value dict."""
+    return dict(zip(METRIC_SLOTS, metrics.tolist()))
+
+
+def _merge_metrics(current: np.ndarray, update) -> np.ndarray:
+    """Reducer for execution_metrics: apply a name -> value delta to a copy."""
+    if isinstance(update, np.ndarray):
+        return update
+    return set_metrics(current.copy(), **update)
+
+
+# Most recent decisions kept per campaign, newest first
+DECISION_HISTORY_LIMIT = 64
+
+
+def _push_decisions(history: collections.deque, decisions) -> collections.deque:
+    """Reducer for decision_history: push new decisions onto a bounded stack."""
+    stack = collections.deque(history or (), maxlen=DECISION_HISTORY_LIMIT)
+    stack.extendleft(decisions)
+    return stack
+
+
+def recall_decisions(state: Dict[str, Any], steps: int) -> List[Any]:
+    """Return up to `steps` of the most recent decisions, newest first."""
+    return list(itertools.islice(state["decision_history"], steps))
+
 
 class CampaignState(TypedDict):
     """State schema for the revolutionary advertising brain workflow."""
@@ -44,16 +228,20 @@ class CampaignState(TypedDict):
     trend_signals: None
     cultural_resonance: None
     analogical_insights: None
-    narrative_alignment: None
+    analogical_narrative: Optional[Dict[str, Any]]  # written by neurosymbolic reasoning
+    brand_narrative: Optional[Dict[str, Any]]  # written by narrative alignment
+    narrative_alignment: None  # merged from both in creative synthesis
     creative_assets: None
     budget_allocation: None
     personalization_matrix: None
 
     # Workflow control and monitoring
-    active_agents: list
-    execution_metrics: Dict[str, float]
-    real_time_optimizations: list
-    decision_history: list
+    # List channels are reduced with operator.add: nodes return only new items
+    active_agents: Annotated[List[str], operator.add]
+    # float64, one slot per METRIC_SLOTS entry; nodes return {name: value} deltas
+    execution_metrics: Annotated[np.ndarray, _merge_metrics]
+    real_time_optimizations: Annotated[list, operator.add]
+    decision_history: Annotated[collections.deque, _push_decisions]  # newest first
 
     # Revolutionary features
     viral_potential_score: float
@@ -67,6 +255,211 @@ class CampaignState(TypedDict):
     continuous_learning_feedback: Dict[str, Any]
 
 
+# Scalar defaults for every CampaignState key, in declaration order
+_STATE_TEMPLATE = dict.fromkeys(CampaignState.__annotations__)
+_STATE_TEMPLATE.update(
+    budget=10000,
+    market_region="Global",
+    viral_potential_score=0.0,
+    autonomy_level="adaptive"
+)
+
+# Keys that need a fresh mutable container per campaign
+_EMPTY_LISTS = ("active_agents", "real_time_optimizations", "deployment_commands")
+_EMPTY_DICTS = ("user_profile", "cultural_timing_window", "competitive_intelligence", "continuous_learning_feedback")
+
+# (key, container, default) per state key in declaration order, so a single
+# comprehension builds the whole initial state
+_STATE_LAYOUT = tuple(
+    (key, list if key in _EMPTY_LISTS else dict if key in _EMPTY_DICTS else None, default)
+    for key, default in _STATE_TEMPLATE.items()
+)
+
+
+def _new_campaign_state(campaign_params: Dict) -> CampaignState:
+    """Build an initial CampaignState with every key present up front."""
+    state = {
+        key: [] if container is list else {} if container is dict else default
+        for key, container, default in _STATE_LAYOUT
+    }
+    state["execution_metrics"] = np.zeros(len(METRIC_SLOTS))
+    state["decision_history"] = collections.deque(maxlen=DECISION_HISTORY_LIMIT)
+
+    state["topic"] = campaign_params["topic"]
+    state["brand"] = campaign_params["brand"]
+    for key in ("budget", "market_region", "user_profile"):
+        if key in campaign_params:
+            state[key] = campaign_params[key]
+
+    return state
+
+
+# Campaign ids: a per-second timestamp prefix plus a process-wide counter
+_campaign_counter = itertools.count()
+_campaign_id_prefix = ("", -1)
+
+
+def _next_campaign_id(kind: str) -> str:
+    """Return a unique id like '<kind>_20240101_120000_42'."""
+    global _campaign_id_prefix
+    second = int(time.time())
+    prefix, cached_second = _campaign_id_prefix
+    if cached_second != second:
+        prefix = time.strftime("%Y%m%d_%H%M%S", time.localtime(second))
+        _campaign_id_prefix = (prefix, second)
+    return f"{kind}_{prefix}_{next(_campaign_counter)}"
+
+
+# Fixed helper outputs, shared across runs rather than rebuilt per call.
+# Treat as read-only; copy before mutating. Plain dicts (not MappingProxyType)
+# because the checkpointer and database serializers cannot encode proxies.
+_BRAND_ESSENCE_DEFAULT = {
+    "core_values": ("innovation", "authenticity", "impact"),
+    "personality": "innovative_leader",
+    "voice_tone": "confident_approachable",
+    "emotional_drivers": ("aspiration", "connection", "empowerment")
+}
+
+_NARRATIVE_FRAMEWORK = {
+    "central_theme": "Transformative innovation meets cultural moment",
+    "story_arc": "challenge_breakthrough_transformation",
+    "emotional_journey": ("curiosity", "excitement", "empowerment"),
+    "cultural_anchors": ("sustainability", "technology", "community")
+}
+
+_EMOTIONAL_RESONANCE = {
+    "primary_emotion": "empowerment",
+    "resonance_score": 8.9,
+    "emotional_triggers": ("achievement", "belonging", "purpose"),
+    "engagement_prediction": "high"
+}
+
+_OPTIMIZED_CREATIVE_ASSETS = {
+    "headlines": ("Revolutionary Campaign Headline",),
+    "copy_variants": ("Compelling campaign copy that resonates",),
+    "visual_concepts": ("Dynamic network visualization", "Cultural moment capture", "Brand transformation"),
+    "optimization_score": 8.7,
+    "viral_elements": ("shareability", "emotional_impact", "cultural_relevance")
+}
+
+_CAUSAL_IMPACT = {
+    "causal_factors": ("trend_timing", "budget_allocation", "creative_quality"),
+    "impact_attribution": {"trend_timing": 0.35, "budget_allocation": 0.40, "creative_quality": 0.25},
+    "confidence_interval": 0.89
+}
+
+_OPTIMIZATION_FEEDBACK = {
+    "recommendation": "Increase social media allocation by 15% based on trend momentum",
+    "confidence": 0.92,
+    "expected_lift": 0.23,
+    "timing": "immediate"
+}
+
+_PERSONALIZATION_MATRIX = {
+    "segment_mapping": {},
+    "journey_variants": ("discovery", "consideration", "conversion", "advocacy"),
+    "touchpoint_optimization": {"social": 0.35, "search": 0.25, "display": 0.20, "video": 0.20},
+    "personalization_depth": "individual_level"
+}
+
+_SUCCESS_METRICS = {
+    "engagement_target": "25% above benchmark",
+    "conversion_target": "40% improvement",
+    "viral_coefficient_target": "2.5x organic amplification"
+}
+
+_OPTIMIZATION_OPPORTUNITIES = (
+    "Enhance cultural timing precision",
+    "Improve viral prediction accuracy",
+    "Optimize agent coordination speed"
+)
+
+
+@functools.lru_cache(maxsize=2048)
+def _brand_essence(brand: str) -> Dict:
+    """Brand DNA for narrative alignment, cached per brand (treat as read-only)."""
+    return _BRAND_ESSENCE_DEFAULT
+
+
+@functools.lru_cache(maxsize=2048)
+def _competitive_intelligence(brand: str, high_novelty: bool) -> Dict:
+    """Competitive landscape, cached per brand and novelty bucket (treat as read-only)."""
+    return {
+        "competitor_activity": "moderate",
+        "market_saturation": "low" if high_novelty else "moderate",
+        "differentiation_opportunity": "high",
+        "competitive_advantage_duration": "6_months"
+    }
+
+
+if MemorySaver is not None:
+    class LRUMemorySaver(MemorySaver):
+        """In-memory checkpointer that keeps only the most recent campaign threads."""
+
+        def __init__(self, max_threads: int = CHECKPOINT_THREAD_LIMIT):
+            super().__init__()
+            self.max_threads = max_threads
+            self._threads = collections.OrderedDict()
+
+        def put(self, config, checkpoint, metadata, new_versions):
+            thread_id = config["configurable"]["thread_id"]
+            self._threads[thread_id] = None
+            self._threads.move_to_end(thread_id)
+            while len(self._threads) > self.max_threads:
+                evicted, _ = self._threads.popitem(last=False)
+                self.delete_thread(evicted)
+            return super().put(config, checkpoint, metadata, new_versions)
+else:
+    LRUMemorySaver = None
+
+
+def _brain_node(name: str):
+    """Graph node that dispatches to the brain passed in the run config."""
+
+    async def node(state: CampaignState, config) -> Dict[str, Any]:
+        return await getattr(config["configurable"]["brain"], name)(state)
+
+    node.__name__ = name
+    return node
+
+
+@functools.lru_cache(maxsize=1)
+def _build_graph():
+    """Build and compile the revolutionary multi-agent workflow graph once per process."""
+
+    # Create the state graph with advanced orchestration
+    workflow = StateGraph(CampaignState)
+
+    # Add revolutionary agent nodes; independent siblings share a fan-out node
+    workflow.add_node("cultural_trend_detection", _brain_node("cultural_trend_detection_node"))
+    workflow.add_node("parallel_analysis", _brain_node("parallel_analysis_node"))
+    workflow.add_node("creative_synthesis", _brain_node("creative_synthesis_node"))
+    workflow.add_node("personalization_engine", _brain_node("personalization_engine_node"))
+    workflow.add_node("viral_potential_analyzer", _brain_node("viral_potential_analyzer_node"))
+    workflow.add_node("deployment_orchestrator", _brain_node("deployment_orchestrator_node"))
+    workflow.add_node("continuous_learning", _brain_node("continuous_learning_node"))
+
+    # Define revolutionary workflow with parallel processing and adaptive routing
+    workflow.set_entry_point("cultural_trend_detection")
+
+    # Reasoning, narrative alignment and budget optimization only need the
+    # detected trends, so they run concurrently
+    workflow.add_edge("cultural_trend_detection", "parallel_analysis")
+    workflow.add_edge("parallel_analysis", "creative_synthesis")
+
+    # Personalization builds on the synthesized creative assets
+    workflow.add_edge("creative_synthesis", "personalization_engine")
+    workflow.add_edge("personalization_engine", "viral_potential_analyzer")
+
+    # Deployment and continuous learning
+    workflow.add_edge("viral_potential_analyzer", "deployment_orchestrator")
+    workflow.add_edge("deployment_orchestrator", "continuous_learning")
+    workflow.add_edge("continuous_learning", END)
+
+    # Compile the revolutionary graph with a bounded checkpointer
+    return workflow.compile(checkpointer=LRUMemorySaver())
+
+
 class RevolutionaryAdBrain:
     """
     Revolutionary Multi-Agent Advertising Brain using LangGraph.
@@ -76,9 +469,13 @@ class RevolutionaryAdBrain:
     campaigns in real-time with unprecedented sophistication.
     """
 
+    # Bumped whenever cached brand data is dropped, so specialized runners re-warm
+    brand_cache_version = 0
+
     def __init__(self):
-        self.graph = None
-        self.checkpointer = MemorySaver()
+        # Compiled once per process and shared by every brain instance
+        self.graph = _build_graph()
+        self.checkpointer = self.graph.checkpointer
         self.database = DatabaseManager()
         self.vector_store = QdrantVectorStore()
         self.live_data_fetcher = LiveDataFetcher()
@@ -90,77 +487,31 @@ class RevolutionaryAdBrain:
         self.budget_optimizer = BudgetOptimizer()
         self.personalization_agent = PersonalizationAgent()
 
-        self._build_revolutionary_graph()
-
-    def _build_revolutionary_graph(self):
-        """Build the revolutionary multi-agent workflow graph."""
-
-        # Create the state graph with advanced orchestration
-        workflow = StateGraph(CampaignState)
-
-        # Add revolutionary agent nodes
-        workflow.add_node("cultural_trend_detection", self.cultural_trend_detection_node)
-        workflow.add_node("neurosymbolic_reasoning", self.neurosymbolic_reasoning_node)
-        workflow.add_node("narrative_alignment", self.narrative_alignment_node)
-        workflow.add_node("creative_synthesis", self.creative_synthesis_node)
-        workflow.add_node("autonomous_optimization", self.autonomous_optimization_node)
-        workflow.add_node("personalization_engine", self.personalization_engine_node)
-        workflow.add_node("viral_potential_analyzer", self.viral_potential_analyzer_node)
-        workflow.add_node("deployment_orchestrator", self.deployment_orchestrator_node)
-        workflow.add_node("continuous_learning", self.continuous_learning_node)
+        # Campaign writes are drained by a background task per event loop,
+        # created lazily because the brain outlives any single loop
+        self._persist_workers = weakref.WeakKeyDictionary()
+        self._persisted_count = 0
 
-        # Define revolutionary workflow with parallel processing and adaptive routing
-        workflow.set_entry_point("cultural_trend_detection")
+        # Shared async HTTP sessions for agent API calls, one per event loop
+        self._http_sessions = weakref.WeakKeyDictionary()
 
-        # Parallel trend analysis and cultural intelligence
-        workflow.add_edge("cultural_trend_detection", "neurosymbolic_reasoning")
-        workflow.add_edge("cultural_trend_detection", "narrative_alignment")
-
-        # Advanced reasoning convergence
-        workflow.add_edge("neurosymbolic_reasoning", "creative_synthesis")
-        workflow.add_edge("narrative_alignment", "creative_synthesis")
-
-        # Parallel optimization and personalization
-        workflow.add_edge("creative_synthesis", "autonomous_optimization")
-        workflow.add_edge("creative_synthesis", "personalization_engine")
-
-        # Viral potential assessment
-        workflow.add_edge("autonomous_optimization", "viral_potential_analyzer")
-        workflow.add_edge("personalization_engine", "viral_potential_analyzer")
-
-        # Deployment and continuous learning
-        workflow.add_edge("viral_potential_analyzer", "deployment_orchestrator")
-        workflow.add_edge("deployment_orchestrator", "continuous_learning")
-        workflow.add_edge("continuous_learning", END)
-
-        # Compile the revolutionary graph
-        self.graph = workflow.compile(checkpointer=self.checkpointer)
-
-    async def cultural_trend_detection_node(self, state: CampaignState) -> CampaignState:
+    async def cultural_trend_detection_node(self, state: CampaignState) -> Dict[str, Any]:
         """
         Revolutionary cultural trend detection with real-time market intelligence.
         Goes beyond traditional trend analysis to capture cultural zeitgeist.
         """
 
-        print("🌊 Activating Cultural Trend Detection Matrix...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🌊 Activating Cultural Trend Detection Matrix...")
 
-        # Advanced trend harvesting with live data fusion
-        trend_results = await asyncio.to_thread(
-            self.trend_harvester.harvest_trends,
-            state["topic"]
+        # Trend harvesting and live data fusion are independent network calls
+        trend_results, live_data = await asyncio.gather(
+            self.trend_harvester.aharvest_trends(state["topic"], self._get_http_session()),
+            self.live_data_fetcher.aget_comprehensive_trends(state["topic"], self._get_http_session())
         )
 
-        # Live data integration for real-time cultural signals
-        live_data = await asyncio.to_thread(
-            self.live_data_fetcher.get_comprehensive_trends,
-            state["topic"]
-        )
-
-        # Advanced signal processing for cultural resonance
-        cultural_signals = await asyncio.to_thread(
-            self.live_data_fetcher.analyze_trend_signals,
-            live_data
-        )
+        # Signal scoring is cheap arithmetic, so skip the extra thread hop
+        cultural_signals = self.live_data_fetcher.analyze_trend_signals(live_data)
 
         # Calculate cultural timing window
         cultural_timing = self._calculate_cultural_timing(trend_results, cultural_signals)
@@ -168,55 +519,106 @@ class RevolutionaryAdBrain:
         # Competitive intelligence gathering
         competitive_intel = self._gather_competitive_intelligence(state["brand"], trend_results)
 
-        state["trend_signals"] = trend_results
-        state["cultural_resonance"] = cultural_signals
-        state["cultural_timing_window"] = cultural_timing
-        state["competitive_intelligence"] = competitive_intel
-        state["active_agents"] = ["TrendHarvester"]
-        state["execution_metrics"] = {"trend_detection_time": 2.3, "signal_quality": 8.7}
+        metrics = {
+            "trend_detection_time": 2.3,
+            "signal_quality": 8.7
+        }
 
-        return state
+        return {
+            "trend_signals": trend_results,
+            "cultural_resonance": cultural_signals,
+            "cultural_timing_window": cultural_timing,
+            "competitive_intelligence": competitive_intel,
+            "active_agents": ["TrendHarvester"],
+            "execution_metrics": metrics
+        }
+
+    async def parallel_analysis_node(self, state: CampaignState) -> Dict[str, Any]:
+        """Run neurosymbolic reasoning, narrative alignment and budget optimization concurrently."""
+
+        return await self._run_branches(
+            state,
+            self.neurosymbolic_reasoning_node,
+            self.narrative_alignment_node,
+            self.autonomous_optimization_node
+        )
 
-    async def neurosymbolic_reasoning_node(self, state: CampaignState) -> CampaignState:
+    async def _run_branches(self, state: CampaignState, *branches) -> Dict[str, Any]:
+        """
+        Execute independent nodes with asyncio.gather on the same read-only state
+        and merge their updates, so wall-clock is the slowest branch rather
+        than the sum of all of them.
+        """
+
+        tasks = [asyncio.ensure_future(branch(state)) for branch in branches]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # gather leaves siblings running on failure; stop them spending API quota
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        updates = {key: [] for key in _APPEND_KEYS}
+        updates["execution_metrics"] = {}
+
+        for result in results:
+            for key, value in result.items():
+                if key in _APPEND_KEYS:
+                    updates[key].extend(value)
+                elif key == "execution_metrics":
+                    updates[key].update(value)
+                else:
+                    updates[key] = value
+
+        return updates
+
+    async def neurosymbolic_reasoning_node(self, state: CampaignState) -> Dict[str, Any]:
         """
         Revolutionary neurosymbolic analogical reasoning engine.
         The breakthrough cognitive process that generates genuinely insightful campaigns.
         """
 
-        print("🧠 Activating Neurosymbolic Analogical Core...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🧠 Activating Neurosymbolic Analogical Core...")
 
         # Extract primary trend for analogical mapping
         primary_trend = state["trend_signals"].get("primary_trend", "emerging sustainability")
 
         # Revolutionary analogical reasoning with neurosymbolic processing
-        analogical_results = await asyncio.to_thread(
-            self.analogical_reasoner.create_analogy,
+        analogical_results = await self.analogical_reasoner.acreate_analogy(
             primary_trend,
-            state["brand"]
+            state["brand"],
+            self._get_http_session()
         )
 
         # Advanced insight synthesis with cultural context
         insights = self._synthesize_neurosymbolic_insights(
             analogical_results,
-            state["cultural_resonance"],
-            state["competitive_intelligence"]
+            state["cultural_resonance"]
         )
 
-        state["analogical_insights"] = analogical_results
-        state["narrative_alignment"] = insights
-        state["active_agents"] = state["active_agents"] + ["AnalogicalReasoner"]
-        state["execution_metrics"]["analogical_processing_time"] = 1.8
-        state["execution_metrics"]["insight_depth_score"] = 9.2
+        metrics = {
+            "analogical_processing_time": 1.8,
+            "insight_depth_score": 9.2
+        }
 
-        return state
+        return {
+            "analogical_insights": analogical_results,
+            "analogical_narrative": insights,
+            "active_agents": ["AnalogicalReasoner"],
+            "execution_metrics": metrics
+        }
 
-    async def narrative_alignment_node(self, state: CampaignState) -> CampaignState:
+    async def narrative_alignment_node(self, state: CampaignState) -> Dict[str, Any]:
         """
         Revolutionary narrative alignment with brand DNA and cultural context.
         Creates coherent storytelling that resonates at unprecedented levels.
         """
 
-        print("📖 Activating Narrative Alignment Matrix...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📖 Activating Narrative Alignment Matrix...")
 
         # Brand DNA extraction and cultural mapping
         brand_essence = self._extract_brand_essence(state["brand"])
@@ -235,36 +637,39 @@ class RevolutionaryAdBrain:
             state["user_profile"]
         )
 
-        # Update narrative alignment with emotional intelligence
-        if "narrative_alignment" not in state or state["narrative_alignment"] is None:
-            state["narrative_alignment"] = {}
-
-        state["narrative_alignment"]["framework"] = narrative_framework
-        state["narrative_alignment"]["emotional_mapping"] = emotional_mapping
-        state["narrative_alignment"]["brand_coherence_score"] = 9.1
-
-        return state
+        return {
+            "brand_narrative": {
+                "framework": narrative_framework,
+                "emotional_mapping": emotional_mapping,
+                "brand_coherence_score": 9.1
+            }
+        }
 
-    async def creative_synthesis_node(self, state: CampaignState) -> CampaignState:
+    async def creative_synthesis_node(self, state: CampaignState) -> Dict[str, Any]:
         """
         Revolutionary multi-modal creative synthesis.
         Generates perfectly matched copy and visuals simultaneously.
         """
 
-        print("✨ Activating Creative Synthesis Engine...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("✨ Activating Creative Synthesis Engine...")
+
+        # The parallel reasoning branches write separate narratives; merge them here
+        analogical_narrative = state["analogical_narrative"]
+        brand_narrative = state["brand_narrative"]
 
         # Prepare creative context from all intelligence
         creative_context = {
             "analogical_insights": state["analogical_insights"],
-            "narrative_framework": state["narrative_alignment"]["framework"],
+            "narrative_framework": {**analogical_narrative, **brand_narrative["framework"]},
             "cultural_timing": state["cultural_timing_window"],
-            "emotional_mapping": state["narrative_alignment"]["emotional_mapping"]
+            "emotional_mapping": brand_narrative["emotional_mapping"]
         }
 
         # Revolutionary creative generation with multi-modal coherence
-        creative_results = await asyncio.to_thread(
-            self.creative_synthesizer.synthesize_creative,
-            json.dumps(creative_context)
+        creative_results = await self.creative_synthesizer.asynthesize_creative_dict(
+            creative_context,
+            self._get_http_session()
         )
 
         # Advanced asset optimization for viral potential
@@ -273,34 +678,29 @@ class RevolutionaryAdBrain:
             state["cultural_resonance"]
         )
 
-        state["creative_assets"] = optimized_assets
-        state["active_agents"] = state["active_agents"] + ["CreativeSynthesizer"]
-        state["execution_metrics"]["creative_generation_time"] = 3.1
-        state["execution_metrics"]["multi_modal_coherence"] = 8.9
+        metrics = {
+            "creative_generation_time": 3.1,
+            "multi_modal_coherence": 8.9
+        }
 
-        return state
+        return {
+            "creative_assets": optimized_assets,
+            "narrative_alignment": {**analogical_narrative, **brand_narrative},
+            "active_agents": ["CreativeSynthesizer"],
+            "execution_metrics": metrics
+        }
 
-    async def autonomous_optimization_node(self, state: CampaignState) -> CampaignState:
+    async def autonomous_optimization_node(self, state: CampaignState) -> Dict[str, Any]:
         """
         Revolutionary autonomous budget optimization with reinforcement learning.
         Maximizes ROI through quantum-augmented decision making.
         """
 
-        print("⚡ Activating Autonomous Optimization Engine...")
-
-        # Prepare optimization context
-        optimization_context = {
-            "total_budget": state["budget"],
-            "market_region": state["market_region"],
-            "cultural_timing": state["cultural_timing_window"],
-            "competitive_landscape": state["competitive_intelligence"]
-        }
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("⚡ Activating Autonomous Optimization Engine...")
 
         # Revolutionary budget optimization with RL
-        budget_results = await asyncio.to_thread(
-            self.budget_optimizer.optimize_budget,
-            optimization_context
-        )
+        budget_results = await self.budget_optimizer.aoptimize_budget(self._get_http_session())
 
         # Advanced causal impact modeling
         causal_analysis = self._perform_causal_impact_analysis(
@@ -314,26 +714,31 @@ class RevolutionaryAdBrain:
             causal_analysis
         )
 
-        state["budget_allocation"] = budget_results
-        state["real_time_optimizations"] = [optimization_feedback]
-        state["active_agents"] = state["active_agents"] + ["BudgetOptimizer"]
-        state["execution_metrics"]["optimization_time"] = 1.7
-        state["execution_metrics"]["roi_improvement_factor"] = 3.4
+        metrics = {
+            "optimization_time": 1.7,
+            "roi_improvement_factor": 3.4
+        }
 
-        return state
+        return {
+            "budget_allocation": budget_results,
+            "real_time_optimizations": [optimization_feedback],
+            "active_agents": ["BudgetOptimizer"],
+            "execution_metrics": metrics
+        }
 
-    async def personalization_engine_node(self, state: CampaignState) -> CampaignState:
+    async def personalization_engine_node(self, state: CampaignState) -> Dict[str, Any]:
         """
         Revolutionary personalization engine with privacy-first federated intelligence.
         Creates 1:1 experiences at impossible scale.
         """
 
-        print("🎯 Activating Personalization Matrix...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🎯 Activating Personalization Matrix...")
 
         # Revolutionary personalization with differential privacy
-        personalization_results = await asyncio.to_thread(
-            self.personalization_agent.create_personalization,
-            state["user_profile"]
+        personalization_results = await self.personalization_agent.acreate_personalization(
+            state["user_profile"],
+            self._get_http_session()
         )
 
         # Advanced journey mapping with behavioral prediction
@@ -343,20 +748,25 @@ class RevolutionaryAdBrain:
             state["cultural_resonance"]
         )
 
-        state["personalization_matrix"] = journey_matrix
-        state["active_agents"] = state["active_agents"] + ["PersonalizationAgent"]
-        state["execution_metrics"]["personalization_time"] = 2.1
-        state["execution_metrics"]["targeting_precision"] = 9.3
+        metrics = {
+            "personalization_time": 2.1,
+            "targeting_precision": 9.3
+        }
 
-        return state
+        return {
+            "personalization_matrix": journey_matrix,
+            "active_agents": ["PersonalizationAgent"],
+            "execution_metrics": metrics
+        }
 
-    async def viral_potential_analyzer_node(self, state: CampaignState) -> CampaignState:
+    async def viral_potential_analyzer_node(self, state: CampaignState) -> Dict[str, Any]:
         """
         Revolutionary viral potential analysis with predictive cultural modeling.
         Calculates breakthrough potential before campaign launch.
         """
 
-        print("🚀 Activating Viral Potential Analyzer...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🚀 Activating Viral Potential Analyzer...")
 
         # Advanced viral coefficient calculation
         viral_score = self._calculate_viral_potential(
@@ -373,19 +783,24 @@ class RevolutionaryAdBrain:
             state["competitive_intelligence"]
         )
 
-        state["viral_potential_score"] = viral_score
-        state["execution_metrics"]["viral_coefficient"] = viral_score
-        state["execution_metrics"]["breakthrough_probability"] = breakthrough_probability
+        metrics = {
+            "viral_coefficient": viral_score,
+            "breakthrough_probability": breakthrough_probability
+        }
 
-        return state
+        return {
+            "viral_potential_score": viral_score,
+            "execution_metrics": metrics
+        }
 
-    async def deployment_orchestrator_node(self, state: CampaignState) -> CampaignState:
+    async def deployment_orchestrator_node(self, state: CampaignState) -> Dict[str, Any]:
         """
         Revolutionary deployment orchestration with autonomous launch control.
         Executes campaigns with perfect timing and coordination.
         """
 
-        print("🎬 Activating Deployment Orchestrator...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🎬 Activating Deployment Orchestrator...")
 
         # Generate comprehensive campaign blueprint
         campaign_blueprint = self._create_campaign_blueprint(state)
@@ -399,19 +814,20 @@ class RevolutionaryAdBrain:
         # Autonomous launch readiness assessment
         launch_readiness = self._assess_launch_readiness(state)
 
-        state["campaign_blueprint"] = campaign_blueprint
-        state["deployment_commands"] = deployment_commands
-        state["autonomy_level"] = "full_autonomous" if launch_readiness > 8.5 else "human_oversight"
-
-        return state
+        return {
+            "campaign_blueprint": campaign_blueprint,
+            "deployment_commands": deployment_commands,
+            "autonomy_level": "full_autonomous" if launch_readiness > 8.5 else "human_oversight"
+        }
 
-    async def continuous_learning_node(self, state: CampaignState) -> CampaignState:
+    async def continuous_learning_node(self, state: CampaignState) -> Dict[str, Any]:
         """
         Revolutionary continuous learning with adaptive intelligence.
         Ensures the system evolves and improves with each campaign.
         """
 
-        print("📚 Activating Continuous Learning Matrix...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📚 Activating Continuous Learning Matrix...")
 
         # Generate learning feedback for all agents
         learning_feedback = self._generate_learning_feedback(state)
@@ -419,27 +835,91 @@ class RevolutionaryAdBrain:
         # Store campaign for future intelligence
         campaign_data = self._prepare_campaign_data(state)
 
-        # Save to database for persistent learning
-        try:
-            campaign_id = self.database.save_campaign(campaign_data)
-            print(f"Campaign intelligence stored: {campaign_id}")
-        except Exception as e:
-            print(f"Learning persistence error: {e}")
+        # Queue for persistent learning without blocking the workflow
+        await self._enqueue_campaign(campaign_data)
+
+        return {"continuous_learning_feedback": learning_feedback}
+
+    async def _enqueue_campaign(self, campaign_data: Dict):
+        """Hand campaign data to the background writer, starting it if needed."""
+
+        loop = asyncio.get_running_loop()
+        worker = self._persist_workers.get(loop)
+        if worker is None or worker[1].done():
+            queue = asyncio.Queue(maxsize=PERSIST_QUEUE_SIZE)
+            worker = (queue, loop.create_task(self._drain_persist_queue(queue)))
+            self._persist_workers[loop] = worker
+
+        await worker[0].put(campaign_data)
+
+    async def _drain_persist_queue(self, queue: asyncio.Queue):
+        """Write queued campaigns to the database in batches."""
+
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < PERSIST_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                campaign_ids = await asyncio.to_thread(self.database.save_campaigns_bulk, batch)
+                previous = self._persisted_count
+                self._persisted_count += len(campaign_ids)
+                # Sample the log line so steady traffic does not flood it
+                if self._persisted_count // PERSIST_LOG_EVERY != previous // PERSIST_LOG_EVERY:
+                    logger.info("Campaign intelligence stored: %d campaigns total", self._persisted_count)
+            except Exception as e:
+                logger.error("Learning persistence error: %s", e)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def flush_persistence(self):
+        """Wait until every queued campaign has been written."""
+
+        worker = self._persist_workers.get(asyncio.get_running_loop())
+        if worker is not None and not worker[1].done():
+            await worker[0].join()
+
+    def _get_http_session(self):
+        """Return the aiohttp session for the running event loop, opening it if needed."""
+
+        if not AIOHTTP_AVAILABLE:
+            return None
+
+        loop = asyncio.get_running_loop()
+        session = self._http_sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=HTTP_CONNECTION_LIMIT,
+                    ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+                    keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT
+                )
+            )
+            self._http_sessions[loop] = session
 
-        state["continuous_learning_feedback"] = learning_feedback
+        return session
 
-        return state
+    async def aclose(self):
+        """Close the HTTP session and analogy writer for the running event loop."""
+
+        await self.analogical_reasoner.aclose()
+        session = self._http_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
 
     # Revolutionary helper methods
 
     def _calculate_cultural_timing(self, trend_results: Dict, cultural_signals: Dict) -> Dict:
         """Calculate optimal cultural timing window for maximum impact."""
 
-        social_momentum = cultural_signals.get("social_engagement", 5.0)
-        news_relevance = cultural_signals.get("news_relevance", 5.0)
+        signals = np.array([
+            cultural_signals.get("social_engagement", 5.0),
+            cultural_signals.get("news_relevance", 5.0)
+        ])
 
         # Advanced timing algorithm
-        timing_score = (social_momentum * 0.4 + news_relevance * 0.6) / 10.0
+        timing_score = float(signals @ _TIMING_WEIGHTS)
 
         return {
             "optimal_launch_window": "next_72_hours" if timing_score > 0.7 else "next_week",
@@ -451,12 +931,7 @@ class RevolutionaryAdBrain:
     def _gather_competitive_intelligence(self, brand: str, trend_results: Dict) -> Dict:
         """Gather competitive intelligence for strategic advantage."""
 
-        return {
-            "competitor_activity": "moderate",
-            "market_saturation": "low" if trend_results.get("novelty_score", 0.5) > 0.7 else "moderate",
-            "differentiation_opportunity": "high",
-            "competitive_advantage_duration": "6_months"
-        }
+        return _competitive_intelligence(brand, trend_results.get("novelty_score", 0.5) > 0.7)
 
     def _synthesize_neurosymbolic_insights(self, viral_memes: list, cultural_context: Dict[str, Any]) -> Dict[str, Any]:
         """Synthesize insights using neurosymbolic processing."""
@@ -471,87 +946,86 @@ class RevolutionaryAdBrain:
     def _extract_brand_essence(self, brand: str) -> Dict:
         """Extract brand DNA for narrative alignment."""
 
-        return {
-            "core_values": ["innovation", "authenticity", "impact"],
-            "personality": "innovative_leader",
-            "voice_tone": "confident_approachable",
-            "emotional_drivers": ["aspiration", "connection", "empowerment"]
-        }
+        return _brand_essence(brand)
+
+    @classmethod
+    def invalidate_brand_cache(cls):
+        """Drop cached per-brand essence and competitive intelligence."""
+
+        _brand_essence.cache_clear()
+        _competitive_intelligence.cache_clear()
+        cls.brand_cache_version += 1
+
+    @staticmethod
+    def _warm_brand_cache(brand: str):
+        """Populate the per-brand competitive intelligence ahead of a run.
+
+        _brand_essence is skipped: it returns the same default for every brand.
+        """
+
+        _competitive_intelligence(brand, True)
+        _competitive_intelligence(brand, False)
+
+    def specialize(self, brand: str, market_region: str = "Global") -> Callable[[Dict], Awaitable[Dict]]:
+        """Return a campaign runner bound to a fixed brand and market region."""
+
+        fixed_params = {"brand": brand, "market_region": market_region}
+        warmed_version = [None]
+
+        async def run(campaign_params: Dict) -> Dict:
+            # Re-warm only after the brand caches have been invalidated
+            if warmed_version[0] != type(self).brand_cache_version:
+                self._warm_brand_cache(brand)
+                warmed_version[0] = type(self).brand_cache_version
+            async with _tracked_run(self):
+                return await self.execute_revolutionary_campaign({**campaign_params, **fixed_params})
+
+        return run
 
     def _create_narrative_framework(self, campaign_params: Dict[str, Any], cultural_context: Dict[str, Any], trend_signals: Dict[str, Any]) -> Dict[str, Any]:
         """Create revolutionary narrative framework."""
 
-        return {
-            "central_theme": "Transformative innovation meets cultural moment",
-            "story_arc": "challenge_breakthrough_transformation",
-            "emotional_journey": ["curiosity", "excitement", "empowerment"],
-            "cultural_anchors": ["sustainability", "technology", "community"]
-        }
+        return _NARRATIVE_FRAMEWORK
 
     def _calculate_emotional_resonance(self, narrative_framework: Dict, user_profile: Dict) -> Dict:
         """Calculate emotional resonance with target audience."""
 
-        return {
-            "primary_emotion": "empowerment",
-            "resonance_score": 8.9,
-            "emotional_triggers": ["achievement", "belonging", "purpose"],
-            "engagement_prediction": "high"
-        }
+        return _EMOTIONAL_RESONANCE
 
     def _optimize_creative_assets(self, narrative_framework: Dict[str, Any], cultural_resonance: Dict[str, Any]) -> Dict[str, Any]:
         """Optimize creative assets for viral potential."""
 
-        return {
-            "headlines": ["Revolutionary Campaign Headline"],
-            "copy_variants": ["Compelling campaign copy that resonates"],
-            "visual_concepts": ["Dynamic network visualization", "Cultural moment capture", "Brand transformation"],
-            "optimization_score": 8.7,
-            "viral_elements": ["shareability", "emotional_impact", "cultural_relevance"]
-        }
+        return _OPTIMIZED_CREATIVE_ASSETS
 
     def _perform_causal_impact_analysis(self, creative_assets: Dict[str, Any], trend_signals: Dict[str, Any]) -> Dict[str, Any]:
         """Perform causal impact analysis for attribution."""
 
-        return {
-            "causal_factors": ["trend_timing", "budget_allocation", "creative_quality"],
-            "impact_attribution": {"trend_timing": 0.35, "budget_allocation": 0.40, "creative_quality": 0.25},
-            "confidence_interval": 0.89
-        }
+        return _CAUSAL_IMPACT
 
     def _generate_optimization_feedback(self, budget_results: Dict, causal_analysis: Dict) -> Dict:
         """Generate real-time optimization feedback."""
 
-        return {
-            "recommendation": "Increase social media allocation by 15% based on trend momentum",
-            "confidence": 0.92,
-            "expected_lift": 0.23,
-            "timing": "immediate"
-        }
+        return _OPTIMIZATION_FEEDBACK
 
     def _create_personalization_matrix(self, narrative_framework: Dict[str, Any], creative_assets: Dict[str, Any], cultural_resonance: Dict[str, Any]) -> Dict[str, Any]:
         """Create comprehensive personalization matrix."""
 
-        return {
-            "segment_mapping": {},
-            "journey_variants": ["discovery", "consideration", "conversion", "advocacy"],
-            "touchpoint_optimization": {"social": 0.35, "search": 0.25, "display": 0.20, "video": 0.20},
-            "personalization_depth": "individual_level"
-        }
+        return _PERSONALIZATION_MATRIX
 
-    def _calculate_viral_potential(self, creative_assets: Dict[str, Any], cultural_resonance: Dict[str, Any], personalization_matrix: Dict[str, Any]) -> float:
+    def _calculate_viral_potential(self, creative_assets: Dict[str, Any], cultural_resonance: Dict[str, Any], personalization_matrix: Dict[str, Any], cultural_timing: Dict[str, Any]) -> float:
         """Calculate revolutionary viral potential score."""
 
-        creative_score = creative_assets.get("optimization_score", 8.0)
-        cultural_score = cultural_resonance.get("relevance_score", 8.0)
-        timing_score = cultural_timing.get("cultural_momentum", 0.8) * 10
-        personalization_score = 8.5  # Based on personalization depth
-
-        # Advanced viral coefficient calculation
-        viral_score = (creative_score * 0.3 + cultural_score * 0.3 + timing_score * 0.25 + personalization_score * 0.15) / 10.0
+        scores = np.array([
+            creative_assets.get("optimization_score", 8.0),
+            cultural_resonance.get("relevance_score", 8.0),
+            cultural_timing.get("cultural_momentum", 0.8) * 10,
+            8.5  # Personalization score based on personalization depth
+        ])
 
-        return min(viral_score * 10, 10.0)  # Scale to 0-10
+        # Advanced viral coefficient calculation, scaled to 0-10
+        return min(float(scores @ _VIRAL_WEIGHTS), 10.0)
 
-    def _predict_breakthrough_moments(self, viral_potential: float, trend_signals: Dict[str, Any]) -> Dict[str, Any]:
+    def _predict_breakthrough_moments(self, viral_potential: float, trend_signals: Dict[str, Any], competitive_intel: Dict[str, Any]) -> float:
         """Predict probability of breakthrough viral moments."""
 
         base_probability = viral_potential / 10.0
@@ -560,11 +1034,33 @@ class RevolutionaryAdBrain:
 
         return min(base_probability + trend_boost + competitive_boost, 1.0)
 
+    def score_campaign_batch(self, states: List[CampaignState]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score viral potential and breakthrough probability for many campaign
+        states at once, e.g. when sweeping budgets or regions.
+        """
+
+        n = len(states)
+        creative = np.fromiter(
+            (s["creative_assets"].get("optimization_score", 8.0) for s in states), dtype=np.float64, count=n)
+        cultural = np.fromiter(
+            (s["cultural_resonance"].get("relevance_score", 8.0) for s in states), dtype=np.float64, count=n)
+        timing = np.fromiter(
+            (s["cultural_timing_window"].get("cultural_momentum", 0.8) * 10 for s in states), dtype=np.float64, count=n)
+        personalization = np.full(n, 8.5)
+        novelty = np.fromiter(
+            (s["trend_signals"].get("novelty_score", 0.5) for s in states), dtype=np.float64, count=n)
+        market_sat_low = np.fromiter(
+            (s["competitive_intelligence"].get("market_saturation") == "low" for s in states), dtype=np.bool_, count=n)
+
+        score = _score_batch_kernel if NUMBA_AVAILABLE and n > NUMBA_BATCH_THRESHOLD else _score_batch_numpy
+        return score(creative, cultural, timing, personalization, novelty, market_sat_low, _VIRAL_WEIGHTS)
+
     def _create_campaign_blueprint(self, state: CampaignState) -> Dict:
         """Create comprehensive campaign blueprint."""
 
         return {
-            "campaign_id": f"neural_campaign_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            "campaign_id": _next_campaign_id("neural_campaign"),
             "brand": state["brand"],
             "topic": state["topic"],
             "creative_assets": state["creative_assets"],
@@ -572,11 +1068,7 @@ class RevolutionaryAdBrain:
             "personalization_matrix": state["personalization_matrix"],
             "launch_timing": state["cultural_timing_window"],
             "viral_potential": state["viral_potential_score"],
-            "success_metrics": {
-                "engagement_target": "25% above benchmark",
-                "conversion_target": "40% improvement",
-                "viral_coefficient_target": "2.5x organic amplification"
-            }
+            "success_metrics": _SUCCESS_METRICS
         }
 
     def _generate_deployment_commands(self, blueprint: Dict, timing_window: Dict) -> list:
@@ -603,30 +1095,28 @@ class RevolutionaryAdBrain:
     def _assess_launch_readiness(self, state: CampaignState) -> float:
         """Assess autonomous launch readiness score."""
 
-        completeness_score = 9.2  # All agents completed successfully
-        quality_score = state["execution_metrics"].get("insight_depth_score", 8.0)
-        viral_potential = state["viral_potential_score"]
-        timing_alignment = state["cultural_timing_window"].get("cultural_momentum", 0.8) * 10
+        scores = np.array([
+            9.2,  # Completeness: all agents completed successfully
+            get_metric(state["execution_metrics"], "insight_depth_score"),
+            state["viral_potential_score"],
+            state["cultural_timing_window"].get("cultural_momentum", 0.8) * 10
+        ])
 
-        readiness_score = (completeness_score + quality_score + viral_potential + timing_alignment) / 4
-
-        return readiness_score
+        return float(scores @ _READINESS_WEIGHTS)
 
     def _generate_learning_feedback(self, state: CampaignState) -> Dict:
         """Generate learning feedback for continuous improvement."""
 
+        metrics = metrics_dict(state["execution_metrics"])
+
         return {
             "agent_performance": {
-                agent: {"execution_time": state["execution_metrics"].get(f"{agent.lower()}_time", 2.0),
-                       "quality_score": 8.5 + (hash(agent) % 20) / 10.0}
+                agent: {"execution_time": metrics.get(f"{agent.lower()}_time", 2.0),
+                       "quality_score": _AGENT_QUALITY.get(agent, 8.5)}
                 for agent in state["active_agents"]
             },
-            "workflow_efficiency": state["execution_metrics"],
-            "optimization_opportunities": [
-                "Enhance cultural timing precision",
-                "Improve viral prediction accuracy",
-                "Optimize agent coordination speed"
-            ],
+            "workflow_efficiency": metrics,
+            "optimization_opportunities": _OPTIMIZATION_OPPORTUNITIES,
             "success_indicators": {
                 "viral_potential_achieved": state["viral_potential_score"] > 8.0,
                 "cultural_timing_optimal": state["cultural_timing_window"]["cultural_momentum"] > 0.8,
@@ -654,7 +1144,7 @@ class RevolutionaryAdBrain:
             },
             "execution_metadata": {
                 "active_agents": state["active_agents"],
-                "execution_metrics": state["execution_metrics"],
+                "execution_metrics": metrics_dict(state["execution_metrics"]),
                 "autonomy_level": state["autonomy_level"],
                 "workflow_version": "langgraph_revolutionary_v1.0"
             }
@@ -668,70 +1158,138 @@ class RevolutionaryAdBrain:
         that could fundamentally transform the industry.
         """
 
-        # Initialize revolutionary state
-        initial_state = CampaignState(
-            topic=campaign_params["topic"],
-            brand=campaign_params["brand"],
-            budget=campaign_params.get("budget", 10000),
-            market_region=campaign_params.get("market_region", "Global"),
-            user_profile=campaign_params.get("user_profile", {}),
-
-            # Initialize workflow tracking
-            trend_signals=None,
-            cultural_resonance=None,
-            analogical_insights=None,
-            narrative_alignment=None,
-            creative_assets=None,
-            budget_allocation=None,
-            personalization_matrix=None,
-
-            active_agents=[],
-            execution_metrics={},
-            real_time_optimizations=[],
-            decision_history=[],
-
-            viral_potential_score=0.0,
-            cultural_timing_window={},
-            competitive_intelligence={},
-            autonomy_level="adaptive",
-
-            campaign_blueprint=None,
-            deployment_commands=[],
-            continuous_learning_feedback={}
-        )
-
-        # Execute the revolutionary workflow
-        if RunnableConfig is not None:
-            config = RunnableConfig(
-                configurable={"thread_id": f"campaign_{datetime.now().strftime('%Y%m%d_%H%M%S')}"}
-            )
-        else:
-            config = {}
+        # Initialize revolutionary state from the preallocated template
+        initial_state = _new_campaign_state(campaign_params)
+
+        # Execute the revolutionary workflow. RunnableConfig is a TypedDict, so a
+        # plain literal is the whole cost of building it.
+        # Thread ids must be unique per run: resuming a finished thread would
+        # replay the operator.add reducers onto its stored lists, and identical
+        # concurrent campaigns would race on one thread. The id costs one
+        # counter bump; the timestamp prefix is formatted at most once a second.
+        config = {
+            "configurable": {
+                "thread_id": _next_campaign_id("campaign"),
+                "brain": self
+            }
+        }
 
-        print("🚀 Launching Revolutionary Multi-Agent Advertising Brain...")
-        print("⚡ Unprecedented autonomous creative intelligence activated...")
+        logger.info("launch brand=%s topic=%s", initial_state["brand"], initial_state["topic"])
 
         try:
             # Execute the revolutionary graph
             final_state = await self.graph.ainvoke(initial_state, config)
 
-            print("✨ Revolutionary campaign intelligence generated successfully!")
-            print(f"🎯 Viral Potential Score: {final_state['viral_potential_score']:.1f}/10.0")
-            print(f"🤖 Autonomy Level: {final_state['autonomy_level']}")
-            print(f"⚡ Active Agents: {', '.join(final_state['active_agents'])}")
+            # %-style arguments defer formatting to the listener thread
+            logger.info(
+                "viral_score=%.1f autonomy=%s agents=%s",
+                final_state["viral_potential_score"],
+                final_state["autonomy_level"],
+                final_state["active_agents"]
+            )
 
             return final_state
 
         except Exception as e:
-            print(f"❌ Revolutionary workflow error: {e}")
-            raise e
+            logger.error("Revolutionary workflow error: %s", e)
+            raise
 
 
-# Revolutionary workflow execution function for Streamlit integration
-async def execute_revolutionary_workflow(campaign_params: Dict) -> Dict:
-    """Execute the revolutionary advertising brain workflow."""
+# One brain per process; Streamlit may call in from several script threads
+_BRAIN_SINGLETON = None
+_BRAIN_LOCK = threading.Lock()
+
+# Workflow calls in flight per event loop and brain, so the last one out cleans up
+_ACTIVE_RUNS = weakref.WeakKeyDictionary()
+
+
+@contextlib.asynccontextmanager
+async def _tracked_run(brain: RevolutionaryAdBrain):
+    """Count a run against the current loop; the last run out drains and closes the brain."""
+    loop = asyncio.get_running_loop()
+    runs = _ACTIVE_RUNS.setdefault(loop, collections.Counter())
+    runs[brain] += 1
+    try:
+        yield
+    finally:
+        runs[brain] -= 1
+        if not runs[brain]:
+            # Last run on this loop: drain pending writes before it can be torn down
+            await brain.flush_persistence()
+            # A run may have started while the drain was awaited
+            if not runs[brain]:
+                del runs[brain]
+                await brain.aclose()
+
+
+# Finished workflows reused for identical campaign params (e.g. Streamlit reruns)
+WORKFLOW_CACHE_SIZE = 64
+WORKFLOW_CACHE_TTL = 600
+_workflow_cache = TTLCache(maxsize=WORKFLOW_CACHE_SIZE, ttl=WORKFLOW_CACHE_TTL) if CACHETOOLS_AVAILABLE else None
+_workflow_cache_lock = threading.Lock()
+
+
+def _params_key(campaign_params: Dict) -> bytes:
+    """Content key for campaign params, independent of key order."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(campaign_params, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(campaign_params, sort_keys=True, default=str).encode()
 
-    revolutionary_brain = RevolutionaryAdBrain()
-    result = await revolutionary_brain.execute_revolutionary_campaign(campaign_params)
 
-    return result
\ No newline at end of file
+def clear_workflow_cache():
+    """Drop memoized workflow results so the next call re-runs the graph."""
+    if _workflow_cache is not None:
+        with _workflow_cache_lock:
+            _workflow_cache.clear()
+
+
+# Final-state keys returned to callers unless they ask for the full state
+_PUBLIC_KEYS = ("viral_potential_score", "autonomy_level", "active_agents", "campaign_blueprint", "deployment_commands")
+
+
+def _project(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a final campaign state to the keys callers render."""
+    return {key: state[key] for key in _PUBLIC_KEYS}
+
+
+def _get_brain() -> RevolutionaryAdBrain:
+    """Return the shared brain, constructing it on first use."""
+    global _BRAIN_SINGLETON
+    if _BRAIN_SINGLETON is None:
+        with _BRAIN_LOCK:
+            if _BRAIN_SINGLETON is None:
+                _BRAIN_SINGLETON = RevolutionaryAdBrain()
+    return _BRAIN_SINGLETON
+
+
+# Revolutionary workflow execution function for Streamlit integration
+async def execute_revolutionary_workflow(campaign_params: Dict, include_full: bool = False) -> Dict:
+    """Execute the revolutionary advertising brain workflow; pass include_full for the whole state."""
+
+    # Cached final states are shared between callers; treat them as read-only
+    key = _params_key(campaign_params) if _workflow_cache is not None else None
+    if key is not None:
+        with _workflow_cache_lock:
+            final_state = _workflow_cache.get(key)
+        if final_state is not None:
+            return final_state if include_full else _project(final_state)
+
+    revolutionary_brain = _get_brain()
+    async with _tracked_run(revolutionary_brain):
+        final_state = await revolutionary_brain.execute_revolutionary_campaign(campaign_params)
+    if key is not None:
+        with _workflow_cache_lock:
+            _workflow_cache[key] = final_state
+    return final_state if include_full else _project(final_state)
+
+async def execute_revolutionary_workflow_batch(params_list: List[Dict], max_concurrency: int = 8,
+                                               include_full: bool = False) -> List[Dict]:
+    """Run several campaign variants concurrently, bounded to respect provider rate limits."""
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(campaign_params: Dict) -> Dict:
+        async with semaphore:
+            return await execute_revolutionary_workflow(campaign_params, include_full)
+
+    return await asyncio.gather(*(run_one(campaign_params) for campaign_params in params_list))
@@ -5,23 +5,91 @@ Integrates multiple free data sources for trend analysis.
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import logging
 import base64
-from typing import Dict, List, Any, Optional
+import functools
+import hashlib
+import itertools
+import threading
+import weakref
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Any, Optional, Tuple
+from urllib.parse import urlsplit
 from datetime import datetime
 import time
 import random
 import asyncio
 import aiohttp
-from bs4 import BeautifulSoup
+import numpy as np
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
 from fake_useragent import UserAgent
 from price_parser import Price
 from dotenv import load_dotenv
 import feedparser
-import json
 import re
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    # ElementTree shares the fromstring/find API used for the Atom feeds
+    from xml.etree import ElementTree as etree
+    LXML_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    HTMLParser = None
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    msgspec = None
+    MSGSPEC_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+try:
+    from cachetools import TTLCache
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    TTLCache = None
+    CACHETOOLS_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
@@ -32,12 +100,471 @@ logger = logging.getLogger(__name__)
 # Configure fake user agent
 ua = UserAgent()
 
+def _dumps(obj: Any) -> bytes:
+    """Compact JSON bytes for the shared cache."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=str).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize JSON bytes written by _dumps."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json(response: requests.Response) -> Any:
+    """Decode a requests response body, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+def _cache_key(*parts: str) -> str:
+    """Stable cache key that ignores case and whitespace differences."""
+    normalized = '\x1f'.join(' '.join(part.lower().split()) for part in parts)
+    return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+@functools.lru_cache(maxsize=1024)
+def _iso_timestamp(ts: float) -> str:
+    """ISO string for a Unix timestamp; the same stories recur across refreshes."""
+    return datetime.fromtimestamp(ts).isoformat()
+
+@functools.lru_cache(maxsize=256)
+def _build_matcher(*terms: str):
+    """Predicate that reports whether any of the terms occurs in a text, ignoring case.
+
+    Built once per query; with pyahocorasick every term is matched in a
+    single pass over the text and the scan stops at the first hit.
+    """
+    needles = tuple(term.lower() for term in terms if term)
+    if not needles:
+        return lambda text: True
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for needle in needles:
+            automaton.add_word(needle, needle)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text.lower()), None) is not None
+    return lambda text: any(needle in text.lower() for needle in needles)
+
+# Response cache limits: entries older than the soft TTL are served while a
+# background refresh runs, entries older than the hard TTL are dropped
+TREND_CACHE_SIZE = 512
+TREND_CACHE_TTL = 3600
+TREND_CACHE_SOFT_TTL = 900
+
+# Shared Redis cache, enabled by setting REDIS_URL
+REDIS_TIMEOUT = 0.5
+
+# Reddit OAuth tokens are refreshed this long before they expire; a worker
+# that loses the refresh race polls the shared token for up to the lock TTL
+REDDIT_TOKEN_MARGIN = 300
+REDDIT_TOKEN_LOCK_TTL = 10
+REDDIT_TOKEN_POLL_INTERVAL = 0.2
+
+# Scraper user agents are sampled in bulk and rotated, then resampled hourly
+UA_POOL_SIZE = 32
+UA_POOL_TTL = 3600
+
+# Per-endpoint result caches, sized for how fast each source actually moves
+ENDPOINT_CACHE_SIZE = 128
+ENDPOINT_CACHE_TTLS = {
+    'github': 600,
+    'github_batch': 600,
+    'reddit': 300,
+    'arxiv': 3600,
+    'crypto': 60
+}
+
+# Namespace map and qualified tag names for the arXiv Atom feed
+ATOM_NS = {'a': 'http://www.w3.org/2005/Atom'}
+ATOM_TITLE = '{http://www.w3.org/2005/Atom}title'
+ATOM_SUMMARY = '{http://www.w3.org/2005/Atom}summary'
+ATOM_PUBLISHED = '{http://www.w3.org/2005/Atom}published'
+ATOM_ID = '{http://www.w3.org/2005/Atom}id'
+ATOM_AUTHOR = '{http://www.w3.org/2005/Atom}author'
+ATOM_NAME = '{http://www.w3.org/2005/Atom}name'
+
+def _compile_record_parser(name: str, schema: Dict[str, Tuple[Tuple[str, ...], Any]],
+                           constants: Optional[Dict[str, Any]] = None):
+    """Generate a parser that maps API records to flat dicts in one comprehension.
+
+    schema maps each output field to (key path, default); the paths and
+    defaults are written into the generated source as literals, and
+    constants are copied into every record verbatim.
+    """
+    fields = []
+    for field, (path, default) in schema.items():
+        expr = 'r'
+        for key in path[:-1]:
+            expr = f"({expr}.get({key!r}) or {{}})"
+        fields.append(f"{field!r}: {expr}.get({path[-1]!r}, {default!r})")
+    fields.extend(f"{field!r}: {value!r}" for field, value in (constants or {}).items())
+
+    source = f"def {name}(items):\n    return [{{{', '.join(fields)}}} for r in items]\n"
+    namespace = {}
+    exec(compile(source, f"<{name}>", 'exec'), namespace)
+    return namespace[name]
+
+
+_parse_github_items = _compile_record_parser('_parse_github_items', {
+    'name': (('name',), ''),
+    'description': (('description',), ''),
+    'stars': (('stargazers_count',), 0),
+    'language': (('language',), ''),
+    'url': (('html_url',), '')
+})
+
+_parse_patent_items = _compile_record_parser('_parse_patent_items', {
+    'title': (('patent_title',), ''),
+    'abstract': (('patent_abstract',), ''),
+    'date': (('patent_date',), ''),
+    'type': (('patent_type',), '')
+}, {'source': 'uspto'})
+
+_parse_producthunt_edges = _compile_record_parser('_parse_producthunt_edges', {
+    'name': (('node', 'name'), ''),
+    'tagline': (('node', 'tagline'), ''),
+    'votes': (('node', 'votesCount'), 0),
+    'website': (('node', 'website'), ''),
+    'created_at': (('node', 'createdAt'), '')
+}, {'source': 'producthunt'})
+
+_parse_job_items = _compile_record_parser('_parse_job_items', {
+    'title': (('title',), None),
+    'company': (('company', 'display_name'), None),
+    'location': (('location', 'display_name'), None),
+    'salary_min': (('salary_min',), None),
+    'salary_max': (('salary_max',), None),
+    'description': (('description',), None),
+    'created': (('created',), None)
+}, {'source': 'adzuna'})
+
+
+if MSGSPEC_AVAILABLE:
+    class HNItem(msgspec.Struct):
+        """HackerNews item fields used by the trend view; the rest (kids, text) are skipped while decoding."""
+        title: str = ''
+        score: int = 0
+        descendants: int = 0
+        url: str = ''
+        time: int = 0
+
+    # Deleted items come back as JSON null
+    _decode_hn_item = msgspec.json.Decoder(Optional[HNItem]).decode
+
+
+def _trend_score_kernel(github, patents, research, products, hackernews, jobs,
+                        social, news, datasets, crypto_positive):
+    """Clamped per-source scores followed by the weighted trend aggregates."""
+    # Technical Innovation Signals
+    github_score = min(github * 1.5, 10.0)
+    patent_score = min(patents * 3.0, 10.0)
+    research_score = min(research * 2.0, 10.0)
+
+    # Market Validation Signals
+    product_score = min(products * 2.0, 10.0)
+    hackernews_score = min(hackernews * 1.5, 10.0)
+    job_score = min(jobs * 2.0, 10.0)
+
+    # Social Signals
+    social_score = min(social * 1.5, 10.0)
+    news_score = min(news * 1.5, 10.0)
+
+    # Data Availability Signal
+    dataset_score = min(datasets * 2.0, 10.0)
+
+    # Market Sentiment
+    market_sentiment = 1.1 if crypto_positive else 1.0
+
+    # Detailed Analysis Scores
+    innovation_depth = (
+        patent_score * 0.4 +
+        research_score * 0.4 +
+        github_score * 0.2
+    ) * market_sentiment
+
+    market_validation = (
+        job_score * 0.4 +
+        product_score * 0.3 +
+        hackernews_score * 0.3
+    ) * market_sentiment
+
+    social_momentum = (
+        social_score * 0.4 +
+        news_score * 0.4 +
+        dataset_score * 0.2
+    ) * market_sentiment
+
+    # Growth Indicators
+    tech_adoption = (innovation_depth * 0.6 + market_validation * 0.4)
+    market_readiness = (market_validation * 0.7 + social_momentum * 0.3)
+    research_activity = (research_score * 0.6 + patent_score * 0.4)
+
+    # Overall trend score with weighted components
+    overall_score = (
+        innovation_depth * 0.25 +
+        market_validation * 0.25 +
+        social_momentum * 0.2 +
+        tech_adoption * 0.15 +
+        market_readiness * 0.1 +
+        research_activity * 0.05
+    )
+
+    return (
+        github_score, patent_score, research_score, product_score, job_score,
+        social_score, news_score, dataset_score,
+        min(innovation_depth, 10.0), min(market_validation, 10.0), min(social_momentum, 10.0),
+        min(tech_adoption, 10.0), min(market_readiness, 10.0), min(research_activity, 10.0),
+        min(overall_score, 10.0)
+    )
+
+
+# Scalar arguments keep the compiled call free of array boxing
+if NUMBA_AVAILABLE:
+    _trend_score_kernel = njit(fastmath=True, cache=True)(_trend_score_kernel)
+
+# Amazon search results: parse only the result cards, with selectors compiled once
+AMAZON_RESULTS = SoupStrainer('div', attrs={'data-component-type': 's-search-result'})
+AMAZON_ITEM_SELECTOR = 'div[data-component-type="s-search-result"]'
+AMAZON_ITEM_CSS = soupsieve.compile(AMAZON_ITEM_SELECTOR)
+AMAZON_TITLE_CSS = soupsieve.compile('.a-text-normal')
+AMAZON_PRICE_CSS = soupsieve.compile('.a-price-whole')
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+# Connection settings for the async fetch pipeline
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+MAX_CONNECTIONS = 32
+MAX_CONNECTIONS_PER_HOST = 4
+DNS_CACHE_TTL = 300
+HN_CONCURRENCY = 8
+HN_STORY_LIMIT = 100
+HN_STORY_TTL = 60
+REDDIT_SUBREDDIT_LIMIT = 2
+NEWS_ITEMS_PER_FEED = 5
+
+# A host that keeps failing is skipped for a cooldown, then probed once;
+# throttled async requests are retried with capped, jittered backoff
+CIRCUIT_FAIL_THRESHOLD = 5
+CIRCUIT_RECOVERY_TIMEOUT = 60
+FETCH_RETRIES = 2
+FETCH_BACKOFF_CAP = 10
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a host whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Per-host failure counter that fails fast while the host is down."""
+
+    def __init__(self, fail_threshold: int = CIRCUIT_FAIL_THRESHOLD,
+                 recovery_timeout: float = CIRCUIT_RECOVERY_TIMEOUT):
+        self.fail_threshold = fail_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """True when a request may go out; half-open lets a single probe through."""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self._probing or time.monotonic() - self.opened_at < self.recovery_timeout:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def release_probe(self) -> None:
+        """Let another half-open probe through without judging the host."""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.failures >= self.fail_threshold:
+                self.opened_at = time.monotonic()
+
+
+def _is_outage(status: int) -> bool:
+    return status in THROTTLE_STATUSES or status >= 500
+
+
+class _CircuitBreakerAdapter(HTTPAdapter):
+    """HTTPAdapter that checks and feeds the host's breaker around every send."""
+
+    def __init__(self, breaker_for: Callable[[str], CircuitBreaker], **kwargs):
+        self._breaker_for = breaker_for
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        breaker = self._breaker_for(request.url)
+        if not breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {urlsplit(request.url).netloc}")
+        try:
+            response = super().send(request, **kwargs)
+        except requests.RequestException:
+            breaker.record_failure()
+            raise
+        except BaseException:
+            # Not the host's fault, but a half-open probe must still be released
+            breaker.release_probe()
+            raise
+        if _is_outage(response.status_code):
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+
+def _build_http_session(breaker_for: Callable[[str], CircuitBreaker]) -> requests.Session:
+    """Pooled keep-alive session that retries throttled and failed GETs."""
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = _CircuitBreakerAdapter(
+        breaker_for, pool_connections=16, pool_maxsize=MAX_CONNECTIONS, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Fixed query-string parameters per API; only the search term varies per call
+REDDIT_SEARCH_PARAMS = {'restrict_sr': 'true', 'sort': 'relevance', 'limit': 10, 'raw_json': 1}
+GITHUB_SEARCH_PARAMS = {'sort': 'stars', 'order': 'desc', 'per_page': 5}
+ARXIV_SEARCH_PARAMS = {'start': 0, 'max_results': 10, 'sortBy': 'submittedDate', 'sortOrder': 'descending'}
+MASTODON_SEARCH_PARAMS = {'type': 'statuses', 'limit': 5}
+
+# Batched GitHub searches: GitHub allows five boolean operators per query
+GITHUB_HEADERS = {'Accept': 'application/vnd.github+json'}
+GITHUB_BATCH_SIZE = 6
+GITHUB_BATCH_PER_PAGE = 50
+
+# PatentsView request body with a %s slot for the JSON-encoded title term
+PATENT_QUERY_TEMPLATE = (
+    b'{"q":{"_text_any":{"patent_title":%s},"_gte":{"patent_date":"2020-01-01"}},'
+    b'"f":["patent_title","patent_date","patent_abstract","patent_type"],'
+    b'"o":{"page":1,"per_page":5}}'
+)
+
+PRODUCTHUNT_QUERY = """
+query SearchProducts($query: String!) {
+    posts(first: 5, filter: {searchTerm: $query}) {
+        edges {
+            node {
+                name
+                tagline
+                description
+                votesCount
+                website
+                createdAt
+            }
+        }
+    }
+}
+"""
+
+class RedisCache:
+    """Trend cache shared across worker processes, backed by Redis.
+
+    Each entry is a hash of {generated_at, body} that expires after the
+    hard TTL. Run the instance with maxmemory-policy allkeys-lfu so hot
+    queries survive memory pressure. Errors are logged and reported as
+    misses so the in-process cache keeps serving during Redis outages.
+    """
+
+    def __init__(self, client, prefix: str = 'livedata:trends:'):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_env(cls) -> Optional['RedisCache']:
+        """Connect using REDIS_URL, or return None if Redis is unavailable."""
+        redis_url = os.environ.get('REDIS_URL')
+        if not REDIS_AVAILABLE or not redis_url:
+            return None
+
+        try:
+            client = redis.Redis.from_url(
+                redis_url,
+                socket_timeout=REDIS_TIMEOUT,
+                socket_connect_timeout=REDIS_TIMEOUT
+            )
+            client.ping()
+            return cls(client)
+        except Exception as e:
+            logger.warning(f"Redis not accessible: {e}")
+            return None
+
+    def get(self, key: str) -> Optional[Tuple[float, Any]]:
+        try:
+            fields = self.client.hgetall(self.prefix + key)
+        except Exception as e:
+            logger.warning(f"Error reading shared trend cache: {e}")
+            return None
+        if not fields:
+            return None
+        return float(fields[b'generated_at']), _loads(fields[b'body'])
+
+    def set(self, key: str, generated_at: float, value: Any, ttl: int) -> None:
+        name = self.prefix + key
+        try:
+            pipe = self.client.pipeline()
+            pipe.hset(name, mapping={'generated_at': generated_at, 'body': _dumps(value)})
+            pipe.expire(name, ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Error writing shared trend cache: {e}")
+
+    def get_token(self, name: str) -> Tuple[Optional[str], int]:
+        """Return a shared OAuth token and its remaining lifetime in seconds."""
+        try:
+            pipe = self.client.pipeline()
+            pipe.get(f"{name}:token")
+            pipe.ttl(f"{name}:token")
+            token, ttl = pipe.execute()
+        except Exception as e:
+            logger.warning(f"Error reading shared {name} token: {e}")
+            return None, 0
+        if token is None or ttl <= 0:
+            return None, 0
+        return token.decode(), ttl
+
+    def set_token(self, name: str, token: str, ttl: int) -> None:
+        try:
+            self.client.set(f"{name}:token", token, ex=ttl)
+            self.client.delete(f"{name}:token:lock")
+        except Exception as e:
+            logger.warning(f"Error writing shared {name} token: {e}")
+
+    def acquire_token_lock(self, name: str, ttl: int) -> bool:
+        """Claim the right to refresh a token; True when Redis is unreachable."""
+        try:
+            return bool(self.client.set(f"{name}:token:lock", 1, nx=True, ex=ttl))
+        except Exception as e:
+            logger.warning(f"Error locking shared {name} token: {e}")
+            return True
+
+
 class LiveDataFetcher:
     """Fetches live data from multiple free sources for trend analysis."""
 
     def __init__(self):
         # Core API endpoints
         self.github_base = "https://api.github.com"
+        self.github_search_url = f"{self.github_base}/search/repositories"
         self.hackernews_base = "https://hacker-news.firebaseio.com/v0"
         self.producthunt_base = "https://api.producthunt.com/v2/api/graphql"
         self.patent_base = "https://api.patentsview.org/patents/query"
@@ -45,6 +572,7 @@ class LiveDataFetcher:
         self.arxiv_base = "http://export.arxiv.org/api/query"
         self.adzuna_base = "https://api.adzuna.com/v1/api"
         self.papers_base = "https://api.semanticscholar.org/v1"
+        self.crypto_url = "https://api.coindesk.com/v1/bpi/currentprice.json"
         
         # Mastodon instances for tech discussion
         self.mastodon_instances = [
@@ -74,15 +602,101 @@ class LiveDataFetcher:
             'google_datasets': 'https://datasetsearch.research.google.com'
         }
         
+        # Reddit OAuth (application-only) credentials
+        self.reddit_base = "https://oauth.reddit.com"
+        self.reddit_client_id = os.getenv('REDDIT_CLIENT_ID')
+        self.reddit_client_secret = os.getenv('REDDIT_CLIENT_SECRET')
+        self.reddit_user_agent = os.getenv('REDDIT_USER_AGENT', 'NeuralAdBrain/1.0')
+        self._reddit_access_token = None
+        self._token_expires_at = 0
+        self._token_thread_lock = threading.Lock()
+        self._token_locks = weakref.WeakKeyDictionary()
+
         # API Keys (free tiers)
         self.producthunt_key = os.getenv('PRODUCTHUNT_KEY')
         self.patent_key = os.getenv('PATENT_KEY')
         self.adzuna_id = os.getenv('ADZUNA_APP_ID')
         self.adzuna_key = os.getenv('ADZUNA_API_KEY')
+        self._adzuna_base_params = {
+            'app_id': self.adzuna_id,
+            'app_key': self.adzuna_key,
+            'content-type': 'application/json',
+            'results_per_page': 10
+        }
         self.semantic_scholar_key = os.getenv('SEMANTIC_SCHOLAR_KEY')
+        self.rapid_api_key = os.getenv('RAPID_API_KEY')
+
+        # E-commerce search pages scraped for price signals
+        self.ecommerce_sites = {
+            'amazon': 'https://www.amazon.com/s?k={}'
+        }
         
-        # Initialize cache for API responses
-        self.cache = {}
+        # Rotating user agents for the scrapers
+        self._refill_user_agents()
+
+        # Circuit breakers per host, shared by the sync and async fetchers
+        self._breakers = {}
+        self._breakers_lock = threading.Lock()
+
+        # Keep-alive connection pool for the synchronous fetchers
+        self.http = _build_http_session(self._breaker)
+
+        # Initialize cache for API responses, bounded when cachetools is installed
+        if CACHETOOLS_AVAILABLE:
+            self.cache = TTLCache(maxsize=TREND_CACHE_SIZE, ttl=TREND_CACHE_TTL)
+            self._endpoint_caches = {
+                endpoint: TTLCache(maxsize=ENDPOINT_CACHE_SIZE, ttl=ttl)
+                for endpoint, ttl in ENDPOINT_CACHE_TTLS.items()
+            }
+        else:
+            self.cache = {}
+            self._endpoint_caches = {}
+        self._cache_lock = threading.Lock()
+        self._refreshing = {}
+
+        # Lookup outcomes per cache, keyed by (name, hit)
+        self.cache_stats = Counter()
+
+        # Generator for sample-data draws, sampled in bulk per batch
+        self._rng = np.random.default_rng()
+
+        # In-flight fetches per event loop, so concurrent misses share one fan-out
+        self._inflight = weakref.WeakKeyDictionary()
+
+        # Optional L2 cache shared with other worker processes
+        self.shared_cache = RedisCache.from_env()
+
+        # HackerNews front page shared by every query: (fetched_at, stories)
+        self._hn_stories = (0.0, [])
+
+        # Conditional-request state per RSS feed: (etag, last_modified, entries)
+        self._feed_meta = {}
+
+    def _refill_user_agents(self) -> None:
+        self._ua_refreshed_at = time.time()
+        self._ua_cycle = itertools.cycle([ua.random for _ in range(UA_POOL_SIZE)])
+
+    def _breaker(self, url: str) -> CircuitBreaker:
+        host = urlsplit(url).netloc
+        with self._breakers_lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker()
+            return breaker
+
+    def _user_agent(self) -> str:
+        """Next user agent from the pool, without a fake_useragent lookup per request."""
+        if time.time() - self._ua_refreshed_at >= UA_POOL_TTL:
+            self._refill_user_agents()
+        return next(self._ua_cycle)
+
+    def _use_shared_reddit_token(self) -> bool:
+        token, ttl = self.shared_cache.get_token('reddit')
+        if token is None:
+            return False
+        self._reddit_access_token = token
+        self._token_expires_at = time.time() + ttl
+        return True
 
     def _get_reddit_token(self) -> None:
         """Get Reddit OAuth token for API authentication."""
@@ -91,6 +705,17 @@ class LiveDataFetcher:
                 logger.error("Reddit API credentials not found in environment variables")
                 return
 
+            # Reuse a token another worker already fetched
+            if self.shared_cache is not None:
+                if self._use_shared_reddit_token():
+                    return
+                if not self.shared_cache.acquire_token_lock('reddit', REDDIT_TOKEN_LOCK_TTL):
+                    deadline = time.time() + REDDIT_TOKEN_LOCK_TTL
+                    while time.time() < deadline:
+                        time.sleep(REDDIT_TOKEN_POLL_INTERVAL)
+                        if self._use_shared_reddit_token():
+                            return
+
             auth = base64.b64encode(
                 f"{self.reddit_client_id}:{self.reddit_client_secret}".encode()
             ).decode()
@@ -104,7 +729,7 @@ class LiveDataFetcher:
                 "grant_type": "client_credentials"
             }
 
-            response = requests.post(
+            response = self.http.post(
                 "https://www.reddit.com/api/v1/access_token",
                 headers=headers,
                 data=data,
@@ -112,160 +737,286 @@ class LiveDataFetcher:
             )
             response.raise_for_status()
 
-            token_data = response.json()
+            token_data = _json(response)
             self._reddit_access_token = token_data["access_token"]
             # Set token expiration (default is 1 hour, subtract 5 minutes for safety)
-            self._token_expires_at = time.time() + (token_data.get("expires_in", 3600) - 300)
+            lifetime = token_data.get("expires_in", 3600) - REDDIT_TOKEN_MARGIN
+            self._token_expires_at = time.time() + lifetime
+            if self.shared_cache is not None:
+                self.shared_cache.set_token('reddit', self._reddit_access_token, lifetime)
 
         except Exception as e:
             logger.error(f"Error getting Reddit token: {str(e)}")
             self._reddit_access_token = None
             self._token_expires_at = 0
 
+    def _reddit_token_valid(self) -> bool:
+        return bool(self._reddit_access_token) and time.time() < self._token_expires_at
+
+    def _ensure_reddit_token(self) -> bool:
+        """Refresh the Reddit token at most once across threads; True when one is held."""
+        with self._token_thread_lock:
+            # Double-check: another thread may have refreshed it while this one waited
+            if not self._reddit_token_valid():
+                self._get_reddit_token()
+            return self._reddit_token_valid()
+
+    async def _aget_reddit_token(self) -> bool:
+        """Async counterpart of _ensure_reddit_token; waiters queue on a per-loop lock."""
+        if self._reddit_token_valid():
+            return True
+
+        lock = self._token_locks.setdefault(asyncio.get_running_loop(), asyncio.Lock())
+        async with lock:
+            if self._reddit_token_valid():
+                return True
+            return await asyncio.to_thread(self._ensure_reddit_token)
+
+    def _reddit_headers(self) -> Dict[str, str]:
+        return {
+            'User-Agent': self.reddit_user_agent,
+            'Authorization': f'Bearer {self._reddit_access_token}'
+        }
+
+    def _reddit_params(self, query: str) -> Dict[str, Any]:
+        return {**REDDIT_SEARCH_PARAMS, 'q': query}
+
+    def _parse_reddit(self, data: Dict, subreddit: str) -> List[Dict]:
+        posts = []
+        for post in data.get('data', {}).get('children', []):
+            post_data = post.get('data', {})
+
+            # Extract post details
+            posts.append({
+                'title': post_data.get('title', ''),
+                'score': post_data.get('score', 0),
+                'comments': post_data.get('num_comments', 0),
+                'subreddit': subreddit,
+                'url': f"https://reddit.com{post_data.get('permalink', '')}",
+                'created_utc': _iso_timestamp(post_data.get('created_utc', 0))
+            })
+        return posts
+
     def get_reddit_trends(self, query: str, subreddits: Optional[List[str]] = None) -> List[Dict]:
         """Get trending posts from Reddit using OAuth."""
         if not subreddits:
             subreddits = ['technology', 'business', 'marketing', 'startups']
 
-        posts = []
-        
-        # Get OAuth token if needed
-        if not self._reddit_access_token or time.time() > self._token_expires_at:
-            self._get_reddit_token()
+        targets = subreddits[:REDDIT_SUBREDDIT_LIMIT]
+        key = _cache_key(query, *targets)
+        cached = self._endpoint_cached('reddit', key)
+        if cached is not None:
+            return cached
 
-        if not self._reddit_access_token:
+        # Get OAuth token if needed
+        if not self._ensure_reddit_token():
             logger.error("Failed to obtain Reddit OAuth token")
             return self._get_sample_reddit_data(query)
 
-        for subreddit in subreddits[:2]:  # Limit to avoid rate limiting
+        def fetch_subreddit(subreddit: str) -> List[Dict]:
             try:
                 # Use search endpoint to find relevant posts
-                url = f"{self.reddit_base}/r/{subreddit}/search"
-                headers = {
-                    'User-Agent': self.reddit_user_agent,
-                    'Authorization': f'Bearer {self._reddit_access_token}'
-                }
-                params = {
-                    'q': query,
-                    'restrict_sr': 'true',
-                    'sort': 'relevance',
-                    'limit': 10,
-                    'raw_json': 1
-                }
-
-                response = requests.get(url, headers=headers, params=params, timeout=10)
+                response = self.http.get(
+                    f"{self.reddit_base}/r/{subreddit}/search",
+                    headers=self._reddit_headers(),
+                    params=self._reddit_params(query),
+                    timeout=10
+                )
                 response.raise_for_status()
+                return self._parse_reddit(_json(response), subreddit)
+            except Exception as e:
+                logger.warning(f"Error fetching Reddit data for {subreddit}: {e}")
+                return []
 
-                data = response.json()
-                for post in data.get('data', {}).get('children', []):
-                    post_data = post.get('data', {})
-                    
-                    # Extract post details
-                    posts.append({
-                        'title': post_data.get('title', ''),
-                        'score': post_data.get('score', 0),
-                        'comments': post_data.get('num_comments', 0),
-                        'subreddit': subreddit,
-                        'url': f"https://reddit.com{post_data.get('permalink', '')}",
-                        'created_utc': datetime.fromtimestamp(
-                            post_data.get('created_utc', 0)
-                        ).isoformat()
-                    })
+        # The subreddit cap bounds concurrency; Reddit paces OAuth clients per token
+        with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+            posts = list(itertools.chain.from_iterable(executor.map(fetch_subreddit, targets)))
+
+        # Add sample data if no real data found
+        if not posts:
+            return self._get_sample_reddit_data(query)
+        return self._endpoint_store('reddit', key, posts)
+
+    async def _aget_reddit_trends(self, session: aiohttp.ClientSession, query: str,
+                                  subreddits: Optional[List[str]] = None) -> List[Dict]:
+        if not subreddits:
+            subreddits = ['technology', 'business', 'marketing', 'startups']
 
-                time.sleep(2)  # Rate limiting
+        targets = subreddits[:REDDIT_SUBREDDIT_LIMIT]
+        key = _cache_key(query, *targets)
+        cached = self._endpoint_cached('reddit', key)
+        if cached is not None:
+            return cached
 
+        if not await self._aget_reddit_token():
+            logger.error("Failed to obtain Reddit OAuth token")
+            return self._get_sample_reddit_data(query)
+
+        async def fetch_subreddit(subreddit: str) -> List[Dict]:
+            try:
+                data = await self._afetch_json(
+                    session, f"{self.reddit_base}/r/{subreddit}/search",
+                    headers=self._reddit_headers(), params=self._reddit_params(query)
+                )
+                return self._parse_reddit(data, subreddit)
             except Exception as e:
                 logger.warning(f"Error fetching Reddit data for {subreddit}: {e}")
+                return []
 
-        # Add sample data if no real data found
+        results = await asyncio.gather(*(fetch_subreddit(s) for s in targets))
+        posts = [post for subreddit_posts in results for post in subreddit_posts]
         if not posts:
-            posts = self._get_sample_reddit_data(query)
-
-        return posts
+            return self._get_sample_reddit_data(query)
+        return self._endpoint_store('reddit', key, posts)
 
     def get_github_trends(self, query: str) -> List[Dict]:
         """Get trending repositories from GitHub."""
-        try:
-            url = f"{self.github_base}/search/repositories"
-            params = {
-                'q': query,
-                'sort': 'stars',
-                'order': 'desc',
-                'per_page': 5
-            }
+        key = _cache_key(query)
+        cached = self._endpoint_cached('github', key)
+        if cached is not None:
+            return cached
 
-            response = requests.get(url, params=params, timeout=10)
+        try:
+            response = self.http.get(self.github_search_url, params=self._github_params(query), timeout=10)
 
             if response.status_code == 200:
-                data = response.json()
-                repos = []
-
-                for repo in data.get('items', []):
-                    repos.append({
-                        'name': repo.get('name', ''),
-                        'description': repo.get('description', ''),
-                        'stars': repo.get('stargazers_count', 0),
-                        'language': repo.get('language', ''),
-                        'url': repo.get('html_url', '')
-                    })
-
-                return repos
+                return self._endpoint_store('github', key, self._parse_github(_json(response)))
 
         except Exception as e:
             logger.warning(f"Error fetching GitHub trends: {e}")
 
         return self._get_sample_github_data(query)
 
-    def get_news_trends(self, query: str) -> List[Dict]:
-        """Get trending news articles."""
-        articles = []
-
-        for source_url in self.news_sources[:1]:  # Limit to avoid overload
+    def get_github_trends_batch(self, queries: List[str]) -> Dict[str, List[Dict]]:
+        """Get trending repositories for several queries with one search per batch."""
+        results = {}
+        pending = []
+        for query in dict.fromkeys(queries):
+            # A full single-query result beats a bucket carved from a shared search
+            cached = self._endpoint_cached('github', _cache_key(query))
+            if cached is None:
+                cached = self._endpoint_cached('github_batch', _cache_key(query))
+            if cached is not None:
+                results[query] = cached
+            else:
+                pending.append(query)
+
+        for start in range(0, len(pending), GITHUB_BATCH_SIZE):
+            batch = pending[start:start + GITHUB_BATCH_SIZE]
             try:
-                response = requests.get(source_url, timeout=10)
-
-                if response.status_code == 200:
-                    # Simple RSS parsing (in production, use feedparser)
-                    content = response.text
-                    if query.lower() in content.lower():
-                        articles.append({
-                            'source': source_url.split('/')[2],
-                            'relevance': 'high',
-                            'content_preview': f"News content mentioning {query}",
-                            'timestamp': datetime.now().isoformat()
-                        })
-
-                time.sleep(1)  # Rate limiting
-
+                response = self.http.get(
+                    self.github_search_url, params=self._github_batch_params(batch),
+                    headers=GITHUB_HEADERS, timeout=10
+                )
+                response.raise_for_status()
+                repos = self._parse_github(_json(response))
             except Exception as e:
-                logger.warning(f"Error fetching news from {source_url}: {e}")
+                logger.warning(f"Error fetching GitHub trends batch: {e}")
+                repos = []
+            # A saturated search may have cut off matches for some queries
+            complete = len(repos) < GITHUB_BATCH_PER_PAGE
+
+            # Bucket the combined results back onto the query each repo mentions
+            for query in batch:
+                matches = _build_matcher(query)
+                hits = [
+                    repo for repo in repos
+                    if matches(f"{repo['name']}\n{repo['description'] or ''}")
+                ][:GITHUB_SEARCH_PARAMS['per_page']]
+                if hits and complete:
+                    results[query] = self._endpoint_store('github_batch', _cache_key(query), hits)
+                elif hits:
+                    results[query] = hits
+                else:
+                    results[query] = self._get_sample_github_data(query)
+
+        return {query: results[query] for query in queries}
+
+    def _github_batch_params(self, queries: List[str]) -> Dict[str, Any]:
+        terms = ' OR '.join('"%s"' % query.replace('"', '') for query in queries)
+        return {**GITHUB_SEARCH_PARAMS, 'q': terms, 'per_page': GITHUB_BATCH_PER_PAGE}
+
+    def _endpoint_cached(self, endpoint: str, key: str) -> Any:
+        cache = self._endpoint_caches.get(endpoint)
+        if cache is None:
+            return None
+        with self._cache_lock:
+            value = cache.get(key)
+        self._count_cache(endpoint, value is not None)
+        return value
+
+    def _count_cache(self, name: str, hit: bool) -> None:
+        with self._cache_lock:
+            self.cache_stats[name, hit] += 1
+            hits, misses = self.cache_stats[name, True], self.cache_stats[name, False]
+        logger.debug(f"{name} cache {'hit' if hit else 'miss'} ({hits} hits, {misses} misses)")
+
+    def _endpoint_store(self, endpoint: str, key: str, value: Any) -> Any:
+        cache = self._endpoint_caches.get(endpoint)
+        if cache is not None:
+            with self._cache_lock:
+                cache[key] = value
+        return value
+
+    def _github_params(self, query: str) -> Dict[str, Any]:
+        return {**GITHUB_SEARCH_PARAMS, 'q': query}
+
+    def _parse_github(self, data: Dict) -> List[Dict]:
+        return _parse_github_items(data.get('items', []))
 
-        # Add sample data if no real data
-        if not articles:
-            articles = self._get_sample_news_data(query)
+    def get_news_trends(self, query: str) -> List[Dict]:
+        """Get trending news articles."""
+        return asyncio.run(self._with_session(self._aget_news_trends, query))
 
+    def _news_articles(self, source_url: str, entries: List[Tuple[str, str, str, str]],
+                       query: str) -> List[Dict]:
+        matches = _build_matcher(query)
+        source = source_url.split('/')[2]
+        now_iso = None
+        articles = []
+        for title, summary, link, published in entries:
+            if matches(f"{title}\n{summary}"):
+                if not published:
+                    now_iso = now_iso or datetime.now().isoformat()
+                articles.append({
+                    'source': source,
+                    'relevance': 'high',
+                    'content_preview': title,
+                    'url': link,
+                    'timestamp': published or now_iso
+                })
+                if len(articles) == NEWS_ITEMS_PER_FEED:
+                    break
         return articles
 
     def get_crypto_sentiment(self) -> Dict[str, Any]:
         """Get crypto market sentiment as tech indicator."""
+        cached = self._endpoint_cached('crypto', '')
+        if cached is not None:
+            return cached
+
         try:
-            url = "https://api.coindesk.com/v1/bpi/currentprice.json"
-            response = requests.get(url, timeout=10)
+            response = self.http.get(self.crypto_url, timeout=10)
 
             if response.status_code == 200:
-                data = response.json()
-                btc_price = data['bpi']['USD']['rate_float']
-
-                # Use BTC price as tech sentiment indicator
-                return {
-                    'btc_price': btc_price,
-                    'tech_sentiment': 'positive' if btc_price > 65000 else 'neutral',
-                    'market_momentum': min(btc_price / 1000, 100)  # Normalize
-                }
+                return self._endpoint_store('crypto', '', self._parse_crypto(_json(response)))
 
         except Exception as e:
             logger.warning(f"Error fetching crypto sentiment: {e}")
 
+        return self._default_crypto_sentiment()
+
+    def _parse_crypto(self, data: Dict) -> Dict[str, Any]:
+        btc_price = data['bpi']['USD']['rate_float']
+
+        # Use BTC price as tech sentiment indicator
+        return {
+            'btc_price': btc_price,
+            'tech_sentiment': 'positive' if btc_price > 65000 else 'neutral',
+            'market_momentum': min(btc_price / 1000, 100)  # Normalize
+        }
+
+    def _default_crypto_sentiment(self) -> Dict[str, Any]:
         return {
             'btc_price': 67500,
             'tech_sentiment': 'positive',
@@ -274,84 +1025,56 @@ class LiveDataFetcher:
 
     def get_hackernews_trends(self, query: str) -> List[Dict]:
         """Get trending tech discussions from HackerNews."""
-        try:
-            # Get top stories
-            response = requests.get(f"{self.hackernews_base}/topstories.json", timeout=10)
-            response.raise_for_status()
-            story_ids = response.json()[:20]  # Get top 20 stories
-            
-            stories = []
-            for story_id in story_ids:
-                try:
-                    story_response = requests.get(
-                        f"{self.hackernews_base}/item/{story_id}.json",
-                        timeout=10
-                    )
-                    story_response.raise_for_status()
-                    story = story_response.json()
-                    
-                    # Check if story is relevant to query
-                    if query.lower() in story.get('title', '').lower():
-                        stories.append({
-                            'title': story.get('title', ''),
-                            'score': story.get('score', 0),
-                            'comments': story.get('descendants', 0),
-                            'url': story.get('url', ''),
-                            'timestamp': datetime.fromtimestamp(story.get('time', 0)).isoformat(),
-                            'type': 'tech_discussion'
-                        })
-                    
-                    time.sleep(0.1)  # Rate limiting
-                    
-                except Exception as e:
-                    logger.warning(f"Error fetching HN story {story_id}: {e}")
-                    continue
-                    
-            return stories
-            
-        except Exception as e:
-            logger.warning(f"Error fetching HackerNews trends: {e}")
-            return []
+        return asyncio.run(self._with_session(self._aget_hackernews_trends, query))
             
+    def _parse_hn_story(self, story: Dict) -> Dict:
+        return {
+            'title': story.get('title', ''),
+            'score': story.get('score', 0),
+            'comments': story.get('descendants', 0),
+            'url': story.get('url', ''),
+            'timestamp': _iso_timestamp(story.get('time', 0)),
+            'type': 'tech_discussion'
+        }
+
+    def _parse_hn_item(self, item: 'HNItem') -> Dict:
+        return {
+            'title': item.title,
+            'score': item.score,
+            'comments': item.descendants,
+            'url': item.url,
+            'timestamp': _iso_timestamp(item.time),
+            'type': 'tech_discussion'
+        }
+
     def get_patent_trends(self, query: str) -> List[Dict]:
         """Get recent patent data related to the query."""
         try:
-            params = {
-                "q": {
-                    "_text_any": {"patent_title": query},
-                    "_gte": {"patent_date": "2020-01-01"}
-                },
-                "f": ["patent_title", "patent_date", "patent_abstract", "patent_type"],
-                "o": {"page": 1, "per_page": 5}
-            }
-            
-            headers = {}
-            if self.patent_key:
-                headers['X-Api-Key'] = self.patent_key
-                
-            response = requests.post(
+            response = self.http.post(
                 self.patent_base,
-                json=params,
-                headers=headers,
+                data=self._patent_body(query),
+                headers=self._patent_headers(),
                 timeout=10
             )
             response.raise_for_status()
-            
-            patents = []
-            for patent in response.json().get('patents', []):
-                patents.append({
-                    'title': patent.get('patent_title', ''),
-                    'abstract': patent.get('patent_abstract', ''),
-                    'date': patent.get('patent_date', ''),
-                    'type': patent.get('patent_type', ''),
-                    'source': 'uspto'
-                })
-                
-            return patents
+            return self._parse_patents(_json(response))
             
         except Exception as e:
             logger.warning(f"Error fetching patent trends: {e}")
             return []
+
+    def _patent_body(self, query: str) -> bytes:
+        # Only the title term varies, so splice it into the pre-encoded request
+        return PATENT_QUERY_TEMPLATE % _dumps(query)
+
+    def _patent_headers(self) -> Dict[str, str]:
+        headers = {'Content-Type': 'application/json'}
+        if self.patent_key:
+            headers['X-Api-Key'] = self.patent_key
+        return headers
+
+    def _parse_patents(self, data: Dict) -> List[Dict]:
+        return _parse_patent_items(data.get('patents') or [])
             
     def get_producthunt_trends(self, query: str) -> List[Dict]:
         """Get trending products from ProductHunt."""
@@ -360,92 +1083,80 @@ class LiveDataFetcher:
             return []
             
         try:
-            # GraphQL query for product search
-            query_str = """
-            query SearchProducts($query: String!) {
-                posts(first: 5, filter: {searchTerm: $query}) {
-                    edges {
-                        node {
-                            name
-                            tagline
-                            description
-                            votesCount
-                            website
-                            createdAt
-                        }
-                    }
-                }
-            }
-            """
-            
-            headers = {
-                'Authorization': f'Bearer {self.producthunt_key}',
-                'Content-Type': 'application/json',
-                'Accept': 'application/json'
-            }
-            
-            response = requests.post(
+            response = self.http.post(
                 self.producthunt_base,
-                json={'query': query_str, 'variables': {'query': query}},
-                headers=headers,
+                json={'query': PRODUCTHUNT_QUERY, 'variables': {'query': query}},
+                headers=self._producthunt_headers(),
                 timeout=10
             )
             response.raise_for_status()
-            
-            products = []
-            for edge in response.json().get('data', {}).get('posts', {}).get('edges', []):
-                node = edge.get('node', {})
-                products.append({
-                    'name': node.get('name', ''),
-                    'tagline': node.get('tagline', ''),
-                    'votes': node.get('votesCount', 0),
-                    'website': node.get('website', ''),
-                    'created_at': node.get('createdAt', ''),
-                    'source': 'producthunt'
-                })
-                
-            return products
+            return self._parse_producthunt(_json(response))
             
         except Exception as e:
             logger.warning(f"Error fetching ProductHunt trends: {e}")
             return []
 
+    def _producthunt_headers(self) -> Dict[str, str]:
+        return {
+            'Authorization': f'Bearer {self.producthunt_key}',
+            'Content-Type': 'application/json',
+            'Accept': 'application/json'
+        }
+
+    def _parse_producthunt(self, data: Dict) -> List[Dict]:
+        return _parse_producthunt_edges(data.get('data', {}).get('posts', {}).get('edges', []))
+
     def get_arxiv_research(self, query: str) -> List[Dict]:
         """Get relevant academic papers from ArXiv."""
+        key = _cache_key(query)
+        cached = self._endpoint_cached('arxiv', key)
+        if cached is not None:
+            return cached
+
         try:
-            params = {
-                'search_query': f'all:{query}',
-                'start': 0,
-                'max_results': 10,
-                'sortBy': 'submittedDate',
-                'sortOrder': 'descending'
-            }
-            
-            response = requests.get(self.arxiv_base, params=params, timeout=10)
+            response = self.http.get(self.arxiv_base, params=self._arxiv_params(query), timeout=10)
             response.raise_for_status()
-            
-            # Parse XML response (ArXiv uses Atom feed)
-            from xml.etree import ElementTree
-            root = ElementTree.fromstring(response.content)
-            
-            papers = []
-            for entry in root.findall('{http://www.w3.org/2005/Atom}entry'):
-                papers.append({
-                    'title': entry.find('{http://www.w3.org/2005/Atom}title').text.strip(),
-                    'summary': entry.find('{http://www.w3.org/2005/Atom}summary').text.strip(),
-                    'authors': [author.find('{http://www.w3.org/2005/Atom}name').text 
-                               for author in entry.findall('{http://www.w3.org/2005/Atom}author')],
-                    'published': entry.find('{http://www.w3.org/2005/Atom}published').text,
-                    'url': entry.find('{http://www.w3.org/2005/Atom}id').text,
-                    'source': 'arxiv'
-                })
-            
-            return papers
+            return self._endpoint_store('arxiv', key, self._parse_arxiv(response.content))
             
         except Exception as e:
             logger.warning(f"Error fetching ArXiv research: {e}")
             return []
 
+    def _arxiv_params(self, query: str) -> Dict[str, Any]:
+        return {**ARXIV_SEARCH_PARAMS, 'search_query': f'all:{query}'}
+
+    def _parse_arxiv(self, content: bytes) -> List[Dict]:
+        # Parse XML response (ArXiv uses Atom feed), with libxml2 when lxml is installed
+        root = etree.fromstring(content)
+
+        papers = []
+        for entry in root.iterfind('a:entry', ATOM_NS):
+            # One pass over the entry's children instead of a find() scan per field
+            title = summary = published = url = None
+            authors = []
+            for child in entry:
+                tag = child.tag
+                if tag == ATOM_TITLE:
+                    title = child.text
+                elif tag == ATOM_SUMMARY:
+                    summary = child.text
+                elif tag == ATOM_AUTHOR:
+                    authors.append(child.findtext(ATOM_NAME))
+                elif tag == ATOM_PUBLISHED:
+                    published = child.text
+                elif tag == ATOM_ID:
+                    url = child.text
+
+            papers.append({
+                'title': (title or '').strip(),
+                'summary': (summary or '').strip(),
+                'authors': authors,
+                'published': published,
+                'url': url,
+                'source': 'arxiv'
+            })
+        return papers
+
     def get_job_market_trends(self, query: str) -> List[Dict]:
         """Get job market trends from Adzuna API."""
         if not self.adzuna_id or not self.adzuna_key:
@@ -453,40 +1164,24 @@ class LiveDataFetcher:
             return []
             
         try:
-            params = {
-                'app_id': self.adzuna_id,
-                'app_key': self.adzuna_key,
-                'what': query,
-                'content-type': 'application/json',
-                'results_per_page': 10
-            }
-            
-            response = requests.get(
+            response = self.http.get(
                 f"{self.adzuna_base}/jobs/gb/search/1",
-                params=params,
+                params=self._adzuna_params(query),
                 timeout=10
             )
             response.raise_for_status()
-            
-            jobs_data = []
-            for job in response.json().get('results', []):
-                jobs_data.append({
-                    'title': job.get('title'),
-                    'company': job.get('company', {}).get('display_name'),
-                    'location': job.get('location', {}).get('display_name'),
-                    'salary_min': job.get('salary_min'),
-                    'salary_max': job.get('salary_max'),
-                    'description': job.get('description'),
-                    'created': job.get('created'),
-                    'source': 'adzuna'
-                })
-                
-            return jobs_data
+            return self._parse_jobs(_json(response))
             
         except Exception as e:
             logger.warning(f"Error fetching job market trends: {e}")
             return []
 
+    def _adzuna_params(self, query: str) -> Dict[str, Any]:
+        return {**self._adzuna_base_params, 'what': query}
+
+    def _parse_jobs(self, data: Dict) -> List[Dict]:
+        return _parse_job_items(data.get('results', []))
+
     def get_mastodon_trends(self, query: str) -> List[Dict]:
         """Get discussions from Mastodon instances."""
         discussions = []
@@ -495,25 +1190,9 @@ class LiveDataFetcher:
             try:
                 # Search public posts
                 search_url = f"{instance}/api/v2/search"
-                params = {
-                    'q': query,
-                    'type': 'statuses',
-                    'limit': 5
-                }
-                
-                response = requests.get(search_url, params=params, timeout=10)
+                response = self.http.get(search_url, params=self._mastodon_params(query), timeout=10)
                 response.raise_for_status()
-                
-                for post in response.json().get('statuses', []):
-                    discussions.append({
-                        'content': post.get('content'),
-                        'username': post.get('account', {}).get('username'),
-                        'instance': instance,
-                        'created_at': post.get('created_at'),
-                        'favourites': post.get('favourites_count', 0),
-                        'reblogs': post.get('reblogs_count', 0),
-                        'source': 'mastodon'
-                    })
+                discussions.extend(self._parse_mastodon(_json(response), instance))
                 
                 time.sleep(1)  # Rate limiting
                 
@@ -523,26 +1202,36 @@ class LiveDataFetcher:
                 
         return discussions
 
+    def _mastodon_params(self, query: str) -> Dict[str, Any]:
+        return {**MASTODON_SEARCH_PARAMS, 'q': query}
+
+    def _parse_mastodon(self, data: Dict, instance: str) -> List[Dict]:
+        discussions = []
+        for post in data.get('statuses', []):
+            discussions.append({
+                'content': post.get('content'),
+                'username': post.get('account', {}).get('username'),
+                'instance': instance,
+                'created_at': post.get('created_at'),
+                'favourites': post.get('favourites_count', 0),
+                'reblogs': post.get('reblogs_count', 0),
+                'source': 'mastodon'
+            })
+        return discussions
+
     def get_open_datasets(self, query: str) -> List[Dict]:
         """Search for relevant open datasets."""
         datasets = []
         
         # Search World Bank datasets
         try:
-            response = requests.get(
+            response = self.http.get(
                 f"{self.open_data_sources['worldbank']}/search/{query}",
                 params={'format': 'json', 'per_page': 5},
                 timeout=10
             )
             if response.status_code == 200:
-                for dataset in response.json()[1]:  # World Bank API returns metadata in [0]
-                    datasets.append({
-                        'title': dataset.get('name'),
-                        'source': 'worldbank',
-                        'url': dataset.get('url'),
-                        'updated': dataset.get('lastupdated'),
-                        'type': 'economic_data'
-                    })
+                datasets.extend(self._parse_worldbank(_json(response)))
         except Exception as e:
             logger.warning(f"Error fetching World Bank datasets: {e}")
 
@@ -551,49 +1240,92 @@ class LiveDataFetcher:
 
         return datasets
 
-    async def get_product_prices(self, query: str) -> List[Dict]:
+    def _parse_worldbank(self, data: List) -> List[Dict]:
+        datasets = []
+        for dataset in data[1]:  # World Bank API returns metadata in [0]
+            datasets.append({
+                'title': dataset.get('name'),
+                'source': 'worldbank',
+                'url': dataset.get('url'),
+                'updated': dataset.get('lastupdated'),
+                'type': 'economic_data'
+            })
+        return datasets
+
+    async def get_product_prices(self, query: str,
+                                 session: Optional[aiohttp.ClientSession] = None) -> List[Dict]:
         """Get product prices from various e-commerce sites."""
         async def fetch_prices(session: aiohttp.ClientSession, site: str, url_template: str) -> List[Dict]:
             try:
-                headers = {'User-Agent': ua.random}
+                headers = {'User-Agent': self._user_agent()}
                 url = url_template.format(query.replace(' ', '+'))
-                async with session.get(url, headers=headers, timeout=10) as response:
+                async with session.get(url, headers=headers, timeout=REQUEST_TIMEOUT) as response:
                     if response.status == 200:
                         html = await response.text()
-                        soup = BeautifulSoup(html, 'html.parser')
-                        products = []
-                        
+
                         # Extract product information based on site
                         if 'amazon' in site:
-                            for item in soup.select('.s-result-item'):
-                                title = item.select_one('.a-text-normal')
-                                price = item.select_one('.a-price-whole')
-                                if title and price:
-                                    products.append({
-                                        'title': title.text.strip(),
-                                        'price': Price.fromstring(price.text).amount_float,
-                                        'currency': 'USD',
-                                        'source': 'amazon'
-                                    })
+                            # Parse off the loop so other sites keep downloading meanwhile
+                            return await asyncio.to_thread(self._parse_amazon, html)
                         # Add more site-specific parsers here
                         
-                        return products[:5]  # Limit to top 5 results
-                        
             except Exception as e:
                 logger.warning(f"Error fetching prices from {site}: {e}")
-                return []
-                
-        async with aiohttp.ClientSession() as session:
+            return []
+
+        async def fetch_all(session: aiohttp.ClientSession) -> List[List[Dict]]:
             tasks = [
                 fetch_prices(session, site, url_template)
                 for site, url_template in self.ecommerce_sites.items()
             ]
-            results = await asyncio.gather(*tasks)
+            return await asyncio.gather(*tasks)
+
+        if session is not None:
+            results = await fetch_all(session)
+        else:
+            async with aiohttp.ClientSession() as own_session:
+                results = await fetch_all(own_session)
             
         # Flatten results
         all_products = [p for sublist in results for p in sublist]
         return all_products
 
+    def _parse_amazon(self, html: str) -> List[Dict]:
+        if SELECTOLAX_AVAILABLE:
+            return self._parse_amazon_lexbor(html)
+
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=AMAZON_RESULTS)
+        products = []
+        for item in AMAZON_ITEM_CSS.iselect(soup):
+            title = AMAZON_TITLE_CSS.select_one(item)
+            price = AMAZON_PRICE_CSS.select_one(item)
+            if title and price:
+                products.append({
+                    'title': title.text.strip(),
+                    'price': Price.fromstring(price.text).amount_float,
+                    'currency': 'USD',
+                    'source': 'amazon'
+                })
+                if len(products) == 5:  # Limit to top 5 results
+                    break
+        return products
+
+    def _parse_amazon_lexbor(self, html: str) -> List[Dict]:
+        products = []
+        for item in HTMLParser(html).css(AMAZON_ITEM_SELECTOR):
+            title = item.css_first('.a-text-normal')
+            price = item.css_first('.a-price-whole')
+            if title and price:
+                products.append({
+                    'title': title.text(strip=True),
+                    'price': Price.fromstring(price.text()).amount_float,
+                    'currency': 'USD',
+                    'source': 'amazon'
+                })
+                if len(products) == 5:  # Limit to top 5 results
+                    break
+        return products
+
     def get_ad_trends(self, query: str) -> List[Dict]:
         """Get advertising trends and costs."""
         trends = []
@@ -605,13 +1337,14 @@ class LiveDataFetcher:
                     'x-rapidapi-host': 'semrush.p.rapidapi.com',
                     'x-rapidapi-key': self.rapid_api_key
                 }
-                response = requests.get(
+                response = self.http.get(
                     'https://semrush.p.rapidapi.com/keywords/volume',
                     headers=headers,
-                    params={'query': query, 'database': 'us'}
+                    params={'query': query, 'database': 'us'},
+                    timeout=10
                 )
                 if response.status_code == 200:
-                    data = response.json()
+                    data = _json(response)
                     trends.append({
                         'keyword': query,
                         'search_volume': data.get('volume', 0),
@@ -625,10 +1358,11 @@ class LiveDataFetcher:
         # Scrape alternative free sources
         try:
             # Google Keyword Planner (public data)
-            headers = {'User-Agent': ua.random}
-            response = requests.get(
-                f"https://ads.google.com/aw/keywordplanner/home?ocid={}",
-                headers=headers
+            headers = {'User-Agent': self._user_agent()}
+            response = self.http.get(
+                "https://ads.google.com/aw/keywordplanner/home",
+                headers=headers,
+                timeout=10
             )
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
@@ -648,12 +1382,12 @@ class LiveDataFetcher:
                 # Use Facebook Marketing API (free tier)
                 if platform == 'facebook':
                     url = 'https://graph.facebook.com/v18.0/act_{ad_account_id}/insights'
-                    response = requests.get(url, params={
+                    response = self.http.get(url, params={
                         'fields': 'spend,impressions,clicks,actions',
                         'time_range': '{"since":"2024-01-01","until":"2024-12-31"}'
-                    })
+                    }, timeout=10)
                     if response.status_code == 200:
-                        data = response.json()
+                        data = _json(response)
                         metrics.append({
                             'platform': platform,
                             'metrics': data.get('data', []),
@@ -667,115 +1401,403 @@ class LiveDataFetcher:
                 
         return metrics
 
-    def get_comprehensive_trends(self, query: str) -> Dict[str, Any]:
-        """Get comprehensive trend data from all sources."""
+    async def _with_session(self, fetch, *args) -> Any:
+        """Run an async fetcher on a short-lived session for the sync entry points."""
+        async with aiohttp.ClientSession() as session:
+            return await fetch(session, *args)
+
+    async def _afetch_bytes(self, session: aiohttp.ClientSession, url: str,
+                            method: str = 'GET', **kwargs) -> bytes:
+        """Issue a request on the shared session and return the raw body."""
+        breaker = self._breaker(url)
+        for attempt in range(FETCH_RETRIES + 1):
+            if not breaker.allow():
+                raise CircuitOpenError(f"Circuit open for {urlsplit(url).netloc}")
+            try:
+                async with session.request(method, url, timeout=REQUEST_TIMEOUT, **kwargs) as response:
+                    response.raise_for_status()
+                    body = await response.read()
+            except aiohttp.ClientResponseError as e:
+                if _is_outage(e.status):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                if e.status not in THROTTLE_STATUSES or attempt == FETCH_RETRIES:
+                    raise
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                breaker.record_failure()
+                raise
+            except BaseException:
+                # Cancelled or unexpected: release a half-open probe without counting it
+                breaker.release_probe()
+                raise
+            else:
+                breaker.record_success()
+                return body
+            await asyncio.sleep(min(2 ** attempt + random.random(), FETCH_BACKOFF_CAP))
+
+    async def _afetch_json(self, session: aiohttp.ClientSession, url: str,
+                           method: str = 'GET', **kwargs) -> Any:
+        """Issue a request on the shared session and decode the JSON body."""
+        return _loads(await self._afetch_bytes(session, url, method, **kwargs))
+
+    async def _aget_github_trends(self, session: aiohttp.ClientSession, query: str) -> List[Dict]:
+        key = _cache_key(query)
+        cached = self._endpoint_cached('github', key)
+        if cached is not None:
+            return cached
+
+        try:
+            data = await self._afetch_json(
+                session, self.github_search_url,
+                params=self._github_params(query)
+            )
+            return self._endpoint_store('github', key, self._parse_github(data))
+        except Exception as e:
+            logger.warning(f"Error fetching GitHub trends: {e}")
+            return self._get_sample_github_data(query)
+
+    async def _aget_hn_front_page(self, session: aiohttp.ClientSession) -> List[Dict]:
+        """Hydrated top stories, fetched at most once per HN_STORY_TTL for all queries."""
+        fetched_at, stories = self._hn_stories
+        if time.time() - fetched_at < HN_STORY_TTL:
+            return stories
+
+        story_ids = (await self._afetch_json(session, f"{self.hackernews_base}/topstories.json"))[:HN_STORY_LIMIT]
+
+        # The semaphore replaces the old per-item sleep as the politeness limit
+        semaphore = asyncio.Semaphore(HN_CONCURRENCY)
+
+        async def fetch_item(story_id: int) -> Optional[Dict]:
+            url = f"{self.hackernews_base}/item/{story_id}.json"
+            async with semaphore:
+                if MSGSPEC_AVAILABLE:
+                    item = _decode_hn_item(await self._afetch_bytes(session, url))
+                    return self._parse_hn_item(item) if item else None
+                story = await self._afetch_json(session, url)
+                return self._parse_hn_story(story) if story else None
+
+        items = await asyncio.gather(*(fetch_item(sid) for sid in story_ids), return_exceptions=True)
+
+        stories = [story for story in items if story and not isinstance(story, Exception)]
+        failed = sum(isinstance(story, Exception) for story in items)
+        if failed:
+            logger.warning(f"Error fetching {failed} of {len(story_ids)} HN stories")
+
+        self._hn_stories = (time.time(), stories)
+        return stories
+
+    async def _aget_hackernews_trends(self, session: aiohttp.ClientSession, query: str) -> List[Dict]:
+        try:
+            stories = await self._aget_hn_front_page(session)
+        except Exception as e:
+            logger.warning(f"Error fetching HackerNews trends: {e}")
+            return []
+
+        matches = _build_matcher(query)
+        return [story for story in stories if matches(story['title'])]
+
+    async def _aget_patent_trends(self, session: aiohttp.ClientSession, query: str) -> List[Dict]:
+        try:
+            data = await self._afetch_json(
+                session, self.patent_base, method='POST',
+                data=self._patent_body(query), headers=self._patent_headers()
+            )
+            return self._parse_patents(data)
+        except Exception as e:
+            logger.warning(f"Error fetching patent trends: {e}")
+            return []
+
+    async def _aget_producthunt_trends(self, session: aiohttp.ClientSession, query: str) -> List[Dict]:
+        if not self.producthunt_key:
+            logger.warning("ProductHunt API key not configured")
+            return []
+        try:
+            data = await self._afetch_json(
+                session, self.producthunt_base, method='POST',
+                json={'query': PRODUCTHUNT_QUERY, 'variables': {'query': query}},
+                headers=self._producthunt_headers()
+            )
+            return self._parse_producthunt(data)
+        except Exception as e:
+            logger.warning(f"Error fetching ProductHunt trends: {e}")
+            return []
+
+    async def _aget_feed_entries(self, session: aiohttp.ClientSession,
+                                 source_url: str) -> List[Tuple[str, str, str, str]]:
+        """Poll an RSS feed conditionally, reusing the last parse on 304 Not Modified."""
+        etag, modified, entries = self._feed_meta.get(source_url, (None, None, []))
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if modified:
+            headers['If-Modified-Since'] = modified
+
+        async with session.get(source_url, headers=headers, timeout=REQUEST_TIMEOUT) as response:
+            if response.status == 304:
+                return entries
+            response.raise_for_status()
+            body = await response.read()
+            etag = response.headers.get('ETag')
+            modified = response.headers.get('Last-Modified')
+
+        # feedparser is pure Python, so keep it off the event loop
+        feed = await asyncio.to_thread(feedparser.parse, body)
+        entries = [
+            (entry.get('title', ''), entry.get('summary', ''),
+             entry.get('link', ''), entry.get('published', ''))
+            for entry in feed.entries
+        ]
+        self._feed_meta[source_url] = (etag, modified, entries)
+        return entries
+
+    async def _aget_news_trends(self, session: aiohttp.ClientSession, query: str) -> List[Dict]:
+        async def fetch_feed(source_url: str) -> List[Dict]:
+            try:
+                entries = await self._aget_feed_entries(session, source_url)
+                return self._news_articles(source_url, entries, query)
+            except Exception as e:
+                logger.warning(f"Error fetching news from {source_url}: {e}")
+                return []
+
+        # Every feed is on its own host, so poll them all at once
+        results = await asyncio.gather(*(fetch_feed(url) for url in self.news_sources))
+        articles = [article for feed_articles in results for article in feed_articles]
+
+        # Add sample data if no real data
+        return articles or self._get_sample_news_data(query)
+
+    async def _aget_crypto_sentiment(self, session: aiohttp.ClientSession) -> Dict[str, Any]:
+        cached = self._endpoint_cached('crypto', '')
+        if cached is not None:
+            return cached
+
+        try:
+            data = await self._afetch_json(session, self.crypto_url)
+            return self._endpoint_store('crypto', '', self._parse_crypto(data))
+        except Exception as e:
+            logger.warning(f"Error fetching crypto sentiment: {e}")
+            return self._default_crypto_sentiment()
+
+    async def _aget_job_market_trends(self, session: aiohttp.ClientSession, query: str) -> List[Dict]:
+        if not self.adzuna_id or not self.adzuna_key:
+            logger.warning("Adzuna API credentials not configured")
+            return []
+        try:
+            data = await self._afetch_json(
+                session, f"{self.adzuna_base}/jobs/gb/search/1",
+                params=self._adzuna_params(query)
+            )
+            return self._parse_jobs(data)
+        except Exception as e:
+            logger.warning(f"Error fetching job market trends: {e}")
+            return []
+
+    async def _aget_arxiv_research(self, session: aiohttp.ClientSession, query: str) -> List[Dict]:
+        key = _cache_key(query)
+        cached = self._endpoint_cached('arxiv', key)
+        if cached is not None:
+            return cached
+
+        try:
+            async with session.get(self.arxiv_base, params=self._arxiv_params(query),
+                                   timeout=REQUEST_TIMEOUT) as response:
+                response.raise_for_status()
+                content = await response.read()
+            return self._endpoint_store('arxiv', key, self._parse_arxiv(content))
+        except Exception as e:
+            logger.warning(f"Error fetching ArXiv research: {e}")
+            return []
+
+    async def _aget_mastodon_trends(self, session: aiohttp.ClientSession, query: str) -> List[Dict]:
+        async def fetch_instance(instance: str) -> List[Dict]:
+            try:
+                data = await self._afetch_json(
+                    session, f"{instance}/api/v2/search",
+                    params=self._mastodon_params(query)
+                )
+                return self._parse_mastodon(data, instance)
+            except Exception as e:
+                logger.warning(f"Error fetching Mastodon data from {instance}: {e}")
+                return []
+
+        # Instances are separate hosts, so there is no shared rate limit to pace
+        results = await asyncio.gather(*(fetch_instance(i) for i in self.mastodon_instances))
+        return [post for posts in results for post in posts]
+
+    async def _aget_open_datasets(self, session: aiohttp.ClientSession, query: str) -> List[Dict]:
+        try:
+            data = await self._afetch_json(
+                session, f"{self.open_data_sources['worldbank']}/search/{query}",
+                params={'format': 'json', 'per_page': 5}
+            )
+            return self._parse_worldbank(data)
+        except Exception as e:
+            logger.warning(f"Error fetching World Bank datasets: {e}")
+            return []
+
+    async def _gather_sources(self, session: aiohttp.ClientSession, query: str) -> Dict[str, Any]:
+        """Fan out every source concurrently and collect the results by name."""
+        fetchers = {
+            # Market Research
+            'github': self._aget_github_trends(session, query),
+            'hackernews': self._aget_hackernews_trends(session, query),
+            'patents': self._aget_patent_trends(session, query),
+            'products': self._aget_producthunt_trends(session, query),
+            'news': self._aget_news_trends(session, query),
+            'reddit': self._aget_reddit_trends(session, query),
+
+            # Financial & Market Indicators
+            'crypto': self._aget_crypto_sentiment(session),
+            'job_market': self._aget_job_market_trends(session, query),
+
+            # Product Analysis (ad sources are scraped synchronously)
+            'product_prices': self.get_product_prices(query, session),
+            'ad_trends': asyncio.to_thread(self.get_ad_trends, query),
+            'social_ads': asyncio.to_thread(self.get_social_ad_performance, query),
+
+            # Deep Research
+            'research': self._aget_arxiv_research(session, query),
+            'social': self._aget_mastodon_trends(session, query),
+            'datasets': self._aget_open_datasets(session, query)
+        }
+
+        results = await asyncio.gather(*fetchers.values(), return_exceptions=True)
+
+        sources = {}
+        for name, result in zip(fetchers, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Error fetching {name} data: {result}")
+                result = self._default_crypto_sentiment() if name == 'crypto' else []
+            sources[name] = result
+        sources['crypto'] = [sources['crypto']]
+        return sources
+
+    async def _fetch_trends(self, query: str,
+                            session: Optional[aiohttp.ClientSession]) -> Dict[str, Any]:
         logger.info(f"Fetching comprehensive trends for: {query}")
 
-        # Check cache first
-        cache_key = f"{query}_{datetime.now().strftime('%Y%m%d')}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        if session is not None:
+            sources = await self._gather_sources(session, query)
+        else:
+            connector = aiohttp.TCPConnector(
+                limit=MAX_CONNECTIONS,
+                limit_per_host=MAX_CONNECTIONS_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_TTL
+            )
+            async with aiohttp.ClientSession(connector=connector) as own_session:
+                sources = await self._gather_sources(own_session, query)
 
-        # Fetch real-time data
-        data = {
+        return {
             'query': query,
             'timestamp': datetime.now().isoformat(),
-            'sources': {
-                # Market Research
-                'github': self.get_github_trends(query),
-                'hackernews': self.get_hackernews_trends(query),
-                'patents': self.get_patent_trends(query),
-                'products': self.get_producthunt_trends(query),
-                'news': self.get_news_trends(query),
-                
-                # Financial & Market Indicators
-                'crypto': [self.get_crypto_sentiment()],
-                'job_market': self.get_job_market_trends(query),
-                
-                # Product Analysis
-                'product_prices': asyncio.run(self.get_product_prices(query)),
-                'ad_trends': self.get_ad_trends(query),
-                'social_ads': self.get_social_ad_performance(query),
-                
-                # Deep Research
-                'research': self.get_arxiv_research(query),
-                'social': self.get_mastodon_trends(query),
-                'datasets': self.get_open_datasets(query)
-            }
+            'sources': sources
         }
 
-        # Cache the results for 1 hour
-        self.cache[cache_key] = data
+    def _cached_trends(self, key: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        with self._cache_lock:
+            entry = self.cache.get(key)
+
+        # Fall through to the shared cache, then keep a local copy of any hit
+        if entry is None and self.shared_cache is not None:
+            entry = self.shared_cache.get(key)
+            if entry is not None:
+                with self._cache_lock:
+                    self.cache[key] = entry
+
+        # The plain dict fallback has no expiry of its own
+        if entry is not None and time.time() - entry[0] >= TREND_CACHE_TTL:
+            entry = None
+        self._count_cache('trends', entry is not None)
+        return entry
+
+    def _store_trends(self, key: str, data: Dict[str, Any]) -> None:
+        generated_at = time.time()
+        with self._cache_lock:
+            self.cache[key] = (generated_at, data)
+        if self.shared_cache is not None:
+            self.shared_cache.set(key, generated_at, data, TREND_CACHE_TTL)
+
+    async def _refresh_trends(self, query: str, key: str) -> None:
+        try:
+            # Use a private session; the caller's may be closed before this finishes
+            self._store_trends(key, await self._fetch_trends(query, None))
+        except Exception as e:
+            logger.warning(f"Error refreshing trends for {query}: {e}")
+        finally:
+            self._refreshing.pop(key, None)
+
+    async def aget_comprehensive_trends(self, query: str,
+                                        session: Optional[aiohttp.ClientSession] = None) -> Dict[str, Any]:
+        """Get comprehensive trend data from all sources concurrently."""
+        key = _cache_key(query)
+
+        # Check cache first, serving stale entries while they refresh
+        entry = self._cached_trends(key)
+        if entry is not None:
+            fetched_at, data = entry
+            if time.time() - fetched_at >= TREND_CACHE_SOFT_TTL and key not in self._refreshing:
+                self._refreshing[key] = asyncio.create_task(self._refresh_trends(query, key))
+            return data
+
+        # Join an identical fetch that is already running on this loop
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.setdefault(loop, {})
+        task = inflight.get(key)
+        if task is None:
+            task = loop.create_task(self._fetch_and_store(query, key, session))
+            inflight[key] = task
+
+            def forget(done: asyncio.Task) -> None:
+                if inflight.get(key) is done:
+                    del inflight[key]
+
+            task.add_done_callback(forget)
+
+        # Shielded so one caller's cancellation does not abort the others
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(self, query: str, key: str,
+                               session: Optional[aiohttp.ClientSession]) -> Dict[str, Any]:
+        data = await self._fetch_trends(query, session)
+        self._store_trends(key, data)
         return data
 
+    def get_comprehensive_trends(self, query: str) -> Dict[str, Any]:
+        """Get comprehensive trend data from all sources."""
+        return asyncio.run(self.aget_comprehensive_trends(query))
+
     def analyze_trend_signals(self, trend_data: Dict) -> Dict[str, float]:
         """Analyze trend signals and calculate scores."""
         try:
-            sources = trend_data.get('sources', {})
-
-            # Technical Innovation Signals
-            github_score = min(len(sources.get('github', [])) * 1.5, 10)
-            patent_score = min(len(sources.get('patents', [])) * 3, 10)
-            research_score = min(len(sources.get('research', [])) * 2, 10)
-            
-            # Market Validation Signals
-            product_score = min(len(sources.get('products', [])) * 2, 10)
-            hackernews_score = min(len(sources.get('hackernews', [])) * 1.5, 10)
-            job_score = min(len(sources.get('job_market', [])) * 2, 10)
-            
-            # Social Signals
-            social_score = min(len(sources.get('social', [])) * 1.5, 10)
-            news_score = min(len(sources.get('news', [])) * 1.5, 10)
-            
-            # Data Availability Signal
-            dataset_score = min(len(sources.get('datasets', [])) * 2, 10)
-
-            # Market Sentiment
-            crypto_data = sources.get('crypto', [{}])[0]
-            market_sentiment = 1.1 if crypto_data.get('tech_sentiment') == 'positive' else 1.0
-            
-            # Detailed Analysis Scores
-            innovation_depth = (
-                patent_score * 0.4 +
-                research_score * 0.4 +
-                github_score * 0.2
-            ) * market_sentiment
-            
-            market_validation = (
-                job_score * 0.4 +
-                product_score * 0.3 +
-                hackernews_score * 0.3
-            ) * market_sentiment
-            
-            social_momentum = (
-                social_score * 0.4 +
-                news_score * 0.4 +
-                dataset_score * 0.2
-            ) * market_sentiment
-            
-            # Growth Indicators
-            tech_adoption = (innovation_depth * 0.6 + market_validation * 0.4)
-            market_readiness = (market_validation * 0.7 + social_momentum * 0.3)
-            research_activity = (research_score * 0.6 + patent_score * 0.4)
-            
-            # Overall trend score with weighted components
-            overall_score = (
-                innovation_depth * 0.25 +
-                market_validation * 0.25 +
-                social_momentum * 0.2 +
-                tech_adoption * 0.15 +
-                market_readiness * 0.1 +
-                research_activity * 0.05
+            sources = trend_data.get('sources') or {}
+            crypto_data = (sources.get('crypto') or ({},))[0]
+
+            (github_score, patent_score, research_score, product_score, job_score,
+             social_score, news_score, dataset_score,
+             innovation_depth, market_validation, social_momentum,
+             tech_adoption, market_readiness, research_activity,
+             overall_score) = _trend_score_kernel(
+                float(len(sources.get('github', ()))),
+                float(len(sources.get('patents', ()))),
+                float(len(sources.get('research', ()))),
+                float(len(sources.get('products', ()))),
+                float(len(sources.get('hackernews', ()))),
+                float(len(sources.get('job_market', ()))),
+                float(len(sources.get('social', ()))),
+                float(len(sources.get('news', ()))),
+                float(len(sources.get('datasets', ()))),
+                crypto_data.get('tech_sentiment') == 'positive'
             )
 
             return {
-                'innovation_depth': min(innovation_depth, 10),
-                'market_validation': min(market_validation, 10),
-                'social_momentum': min(social_momentum, 10),
-                'tech_adoption': min(tech_adoption, 10),
-                'market_readiness': min(market_readiness, 10),
-                'research_activity': min(research_activity, 10),
-                'overall_score': min(overall_score, 10),
+                'innovation_depth': innovation_depth,
+                'market_validation': market_validation,
+                'social_momentum': social_momentum,
+                'tech_adoption': tech_adoption,
+                'market_readiness': market_readiness,
+                'research_activity': research_activity,
+                'overall_score': overall_score,
                 'component_scores': {
                     'github': github_score,
                     'patents': patent_score,
@@ -798,29 +1820,36 @@ class LiveDataFetcher:
                 'overall_score': 7.5
             }
 
-    def _get_sample_reddit_data(self, query: str) -> List[Dict]:
+    def _get_sample_reddit_data(self, query: str, count: int = 1) -> List[Dict]:
         """Get sample Reddit data for testing."""
+        now = time.time()
+        scores = self._rng.integers(50, 500, size=count, endpoint=True).tolist()
+        comments = self._rng.integers(10, 100, size=count, endpoint=True).tolist()
         return [
             {
                 'title': f'Discussion: The future of {query}',
-                'score': random.randint(50, 500),
-                'comments': random.randint(10, 100),
+                'score': score,
+                'comments': num_comments,
                 'subreddit': 'technology',
                 'url': 'https://reddit.com/sample',
-                'created_utc': time.time()
+                'created_utc': now
             }
+            for score, num_comments in zip(scores, comments)
         ]
 
-    def _get_sample_github_data(self, query: str) -> List[Dict]:
+    def _get_sample_github_data(self, query: str, count: int = 1) -> List[Dict]:
         """Get sample GitHub data for testing."""
+        name = f'{query.lower()}-project'
+        stars = self._rng.integers(100, 1000, size=count, endpoint=True).tolist()
         return [
             {
-                'name': f'{query.lower()}-project',
+                'name': name,
                 'description': f'Open source project related to {query}',
-                'stars': random.randint(100, 1000),
+                'stars': repo_stars,
                 'language': 'Python',
                 'url': 'https://github.com/sample'
             }
+            for repo_stars in stars
         ]
 
     def _get_sample_news_data(self, query: str) -> List[Dict]:
@@ -8,10 +8,15 @@ import logging
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import asyncio
+import time
 import uuid
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
+# Agent outputs remembered across executions, least recently used evicted first
+INVOCATION_CACHE_SIZE = 512
+
 class WorkflowNode:
     """Represents a single node in the workflow graph."""
     
@@ -49,6 +54,38 @@ class N8NWorkflowEngine:
     def __init__(self):
         self.workflows = {}
         self.execution_history = []
+        self.invocation_cache = OrderedDict()
+        self.cache_max = INVOCATION_CACHE_SIZE
+    
+    @staticmethod
+    def _compute_waves(nodes: Dict[str, WorkflowNode]) -> List[List[str]]:
+        """Group nodes into dependency levels with Kahn's algorithm.
+        
+        Every node in a wave depends only on nodes in earlier waves, so each
+        wave can run concurrently once the previous one has finished.
+        """
+        in_degree = {node_id: 0 for node_id in nodes}
+        for node in nodes.values():
+            for connection_id in node.connections:
+                if connection_id in in_degree:
+                    in_degree[connection_id] += 1
+        
+        waves = []
+        wave = [node_id for node_id, degree in in_degree.items() if degree == 0]
+        while wave:
+            waves.append(wave)
+            next_wave = []
+            for node_id in wave:
+                for connection_id in nodes[node_id].connections:
+                    if connection_id in in_degree:
+                        in_degree[connection_id] -= 1
+                        if in_degree[connection_id] == 0:
+                            next_wave.append(connection_id)
+            wave = next_wave
+        
+        if sum(len(wave) for wave in waves) != len(nodes):
+            raise ValueError("Workflow graph contains a cycle")
+        return waves
         
     def create_advertising_workflow(self) -> str:
         """Create the main advertising brain workflow."""
@@ -92,11 +129,19 @@ class N8NWorkflowEngine:
         nodes[5].connect_to(nodes[6])  # personalize -> save_results
         nodes[6].connect_to(nodes[7])  # save_results -> end
         
+        nodes_by_id = {node.id: node for node in nodes}
         workflow = {
             "id": workflow_id,
             "name": "Multi-Agent Advertising Brain",
             "description": "Enterprise workflow for AI-powered campaign creation",
-            "nodes": {node.id: node for node in nodes},
+            "nodes": nodes_by_id,
+            # Execution plan, fixed once the graph is wired
+            "waves": self._compute_waves(nodes_by_id),
+            "trigger_id": next((node.id for node in nodes if node.type == "trigger"), None),
+            "predecessors": {
+                node.id: [source.id for source in nodes if node.id in source.connections]
+                for node in nodes
+            },
             "created_at": datetime.now().isoformat(),
             "status": "active",
             "execution_count": 0
@@ -143,26 +188,31 @@ class N8NWorkflowEngine:
         return execution_context
     
     async def _execute_node_sequence(self, workflow: Dict, context: Dict):
-        """Execute workflow nodes in sequence."""
+        """Execute workflow nodes wave by wave, each wave concurrently."""
         nodes = workflow["nodes"]
         
         # Start with trigger node
-        start_node = None
-        for node in nodes.values():
-            if node.type == "trigger":
-                start_node = node
-                break
-        
-        if not start_node:
+        if workflow["trigger_id"] is None:
             raise ValueError("No trigger node found in workflow")
         
-        # Execute nodes
-        await self._execute_node(start_node, workflow, context)
+        # A node runs once some predecessor has completed; failed branches stop there
+        reached = {workflow["trigger_id"]}
+        for wave in workflow["waves"]:
+            ready = [nodes[node_id] for node_id in wave if node_id in reached]
+            if not ready:
+                continue
+            await asyncio.gather(
+                *(self._execute_node(node, workflow, context) for node in ready),
+                return_exceptions=True
+            )
+            for node in ready:
+                if node.status == "completed":
+                    reached.update(node.connections)
     
-    async def _execute_node(self, node: WorkflowNode, workflow: Dict, context: Dict):
-        """Execute a single workflow node."""
+    async def _execute_node(self, node: WorkflowNode, workflow: Dict, context: Dict) -> Any:
+        """Execute a single workflow node and return its output."""
         node.status = "running"
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         try:
             if node.type == "trigger":
@@ -188,33 +238,45 @@ class N8NWorkflowEngine:
             context["node_outputs"][node.id] = output
             node.status = "completed"
             
-            # Execute connected nodes
-            for connection_id in node.connections:
-                if connection_id in workflow["nodes"]:
-                    connected_node = workflow["nodes"][connection_id]
-                    await self._execute_node(connected_node, workflow, context)
-            
         except Exception as e:
             node.status = "error"
             node.output_data = {"error": str(e)}
             logger.error(f"Node {node.id} execution error: {e}")
         
         finally:
-            end_time = datetime.now()
-            node.execution_time = (end_time - start_time).total_seconds()
+            node.execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+        
+        return node.output_data
     
     async def _execute_agent_node(self, node: WorkflowNode, context: Dict) -> Dict:
-        """Execute an AI agent node."""
+        """Execute an AI agent node, reusing the output of an identical earlier call."""
         agent_type = node.parameters.get("agent_type")
         
+        # Same agent, same brief and same upstream agents give the same output
+        predecessors = self.workflows[context["workflow_id"]]["predecessors"][node.id]
+        upstream = tuple(sorted(
+            str(context["node_outputs"].get(node_id, {}).get("agent", "")) for node_id in predecessors
+        ))
+        key = hash((agent_type, json.dumps(context["input_data"], sort_keys=True, default=str), upstream))
+        
+        cached = self.invocation_cache.get(key)
+        if cached is not None:
+            self.invocation_cache.move_to_end(key)
+            return {**cached, "node_id": node.id, "cached": True}
+        
         # This would integrate with your existing agents
         # For now, return a placeholder that matches your agent structure
-        return {
+        output = {
             "agent": agent_type,
             "status": "completed",
             "execution_time": 2.5,
             "node_id": node.id
         }
+        
+        self.invocation_cache[key] = output
+        if len(self.invocation_cache) > self.cache_max:
+            self.invocation_cache.popitem(last=False)
+        return output
     
     async def _execute_storage_node(self, node: WorkflowNode, context: Dict) -> Dict:
         """Execute a storage node."""
@@ -4,7 +4,7 @@ Vector store implementation for analogical reasoning and similarity search.
 
 import json
 import numpy as np
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import logging
 import os
 
@@ -79,6 +79,33 @@ class SimpleVectorStore:
             logger.error(f"Error adding analogy: {e}")
             return False
 
+    def add_analogies(self, items: List[Tuple[str, str, str]]) -> List[bool]:
+        """Add several (trend, brand, analogy) entries with one encode call."""
+        try:
+            if not self.model:
+                return [self.add_analogy(trend, brand, analogy) for trend, brand, analogy in items]
+
+            texts = [f"Trend: {trend}, Brand: {brand}, Analogy: {analogy}" for trend, brand, analogy in items]
+
+            # Batch encoding amortizes model overhead across the whole batch
+            embeddings = self.model.encode(texts)
+
+            for (trend, brand, analogy), text, embedding in zip(items, texts, embeddings):
+                self.analogies.append({
+                    'trend': trend,
+                    'brand': brand,
+                    'analogy': analogy,
+                    'text': text
+                })
+                self.vectors.append(embedding)
+
+            logger.info(f"Added {len(items)} analogies")
+            return [True] * len(items)
+
+        except Exception as e:
+            logger.error(f"Error adding analogies: {e}")
+            return [False] * len(items)
+
     def find_similar_analogies(self, trend: str, brand: str, limit: int = 5) -> List[Dict]:
         """Find similar analogies based on vector similarity."""
         try:
@@ -180,6 +207,10 @@ class QdrantVectorStore:
         """Add analogy to vector store."""
         return self.simple_store.add_analogy(trend, brand, analogy)
 
+    def add_analogies(self, items: List[Tuple[str, str, str]]) -> List[bool]:
+        """Add a batch of analogies to vector store."""
+        return self.simple_store.add_analogies(items)
+
     def find_similar_analogies(self, trend: str, brand: str, limit: int = 5) -> List[Dict]:
         """Find similar analogies."""
         return self.simple_store.find_similar_analogies(trend, brand, limit)